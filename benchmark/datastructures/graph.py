@@ -1,16 +1,27 @@
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 
 class Graph:
     """Graph data structure with adjacency list representation"""
 
     def __init__(self, directed: bool = True):
-        self.adjacency_list: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        # dict-of-dict adjacency: to_node -> weight per node, so duplicate
+        # detection in add_edge is a hash lookup instead of a linear scan
+        self.adjacency_list: Dict[int, Dict[int, float]] = defaultdict(dict)
         self.directed = directed
         self.node_count = 0
         self.edge_count = 0
 
+        # CSR snapshot, built lazily by finalize(); any mutation marks it stale
+        self.indptr = None
+        self.indices = None
+        self.weights = None
+        self._csr_stale = True
+        self._frozen = False
+
     def add_edge(self, from_node: int, to_node: int, weight: float):
         """
         Add an edge to the graph. If edge already exists, update its weight.
@@ -21,40 +32,111 @@ class Graph:
             weight: Edge weight
         """
 
-        edge_exists = False
-        for i, (node, _) in enumerate(self.adjacency_list[from_node]):
-            if node == to_node:
-                self.adjacency_list[from_node][i] = (to_node, weight)
-                edge_exists = True
-                break
+        if self._frozen:
+            raise RuntimeError("graph is frozen; no further edges can be added")
 
-        if not edge_exists:
-            self.adjacency_list[from_node].append((to_node, weight))
+        nbrs = self.adjacency_list[from_node]
+        if to_node not in nbrs:
             self.edge_count += 1
+        nbrs[to_node] = weight
 
         if not self.directed:
-            reverse_exists = False
-            for i, (node, _) in enumerate(self.adjacency_list[to_node]):
-                if node == from_node:
-                    self.adjacency_list[to_node][i] = (from_node, weight)
-                    reverse_exists = True
-                    break
-
-            if not reverse_exists:
-                self.adjacency_list[to_node].append((from_node, weight))
+            self.adjacency_list[to_node][from_node] = weight
 
         self.node_count = max(self.node_count, from_node + 1, to_node + 1)
+        self._csr_stale = True
+
+    def add_edges(self, from_nodes, to_nodes, weights) -> None:
+        """Bulk add_edge over three parallel sequences (or numpy arrays).
+
+        Same update-or-insert semantics as add_edge; per-edge bookkeeping is
+        a couple of dict operations, and the CSR snapshot is invalidated
+        once at the end instead of per edge.
+        """
+        if self._frozen:
+            raise RuntimeError("graph is frozen; no further edges can be added")
+
+        adj = self.adjacency_list
+        max_node = self.node_count - 1
+
+        for u, v, w in zip(from_nodes, to_nodes, weights):
+            u, v, w = int(u), int(v), float(w)
+            nbrs = adj[u]
+            if v not in nbrs:
+                self.edge_count += 1
+            nbrs[v] = w
+            if not self.directed:
+                adj[v][u] = w
+            if u > max_node:
+                max_node = u
+            if v > max_node:
+                max_node = v
+
+        self.node_count = max(self.node_count, max_node + 1)
+        self._csr_stale = True
+
+    def finalize(self) -> None:
+        """Build (or rebuild) the CSR snapshot of the adjacency list.
+
+        indptr/indices/weights are three flat arrays holding every outgoing
+        edge contiguously, so algorithms can slice a node's neighbors without
+        per-edge tuple boxing. Cheap to call repeatedly: a no-op unless an
+        edge was added since the last build.
+        """
+        n = self.node_count
+        if not self._csr_stale and self.indptr is not None \
+                and len(self.indptr) == n + 1:
+            return
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indices: List[int] = []
+        weights: List[float] = []
+        empty: Dict[int, float] = {}
+        for u in range(n):
+            nbrs = self.adjacency_list.get(u, empty)
+            indptr[u + 1] = indptr[u] + len(nbrs)
+            for v, w in nbrs.items():
+                indices.append(v)
+                weights.append(w)
+
+        self.indptr = indptr
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._csr_stale = False
+
+    def freeze(self) -> None:
+        """Finalize the CSR snapshot and lock the graph against mutation.
+
+        Benchmark runs hand the same graph to several solvers in sequence;
+        freezing builds the CSR once up front and turns any accidental
+        mid-run add_edge into a loud error instead of a silent CSR rebuild.
+        """
+        self.finalize()
+        self._frozen = True
 
     def get_neighbors(self, node: int) -> List[Tuple[int, float]]:
-        """Get all neighbors of a node"""
-        return self.adjacency_list.get(node, [])
+        """Get all neighbors of a node as (to_node, weight) pairs"""
+        nbrs = self.adjacency_list.get(node)
+        return list(nbrs.items()) if nbrs else []
+
+    def get_neighbors_csr(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get a node's neighbors as (indices, weights) CSR array views.
+
+        Zero-copy slices into the finalized CSR: callers iterate two flat
+        arrays instead of unpacking a tuple per edge, and can hand the
+        slices straight to vectorized or jitted relaxation loops.
+        """
+        self.finalize()
+        if node < 0 or node >= self.node_count:
+            return self.indices[:0], self.weights[:0]
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end], self.weights[start:end]
 
     def get_all_edges(self) -> List[Tuple[int, int, float]]:
         """Get all edges in the graph"""
         edges = []
         seen = set()
         for from_node, neighbors in self.adjacency_list.items():
-            for to_node, weight in neighbors:
+            for to_node, weight in neighbors.items():
                 if self.directed or (from_node, to_node) not in seen:
                     edges.append((from_node, to_node, weight))
                     if not self.directed:
@@ -1,16 +1,22 @@
 import os, sys
 
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
-
-from benchmark.utils.config import load_config
-from benchmark.utils.sample_runs import (
-    demo_run,
-    run_scaling_benchmark,
-    run_custom_graph,
-)
+# resolved once and guarded, so repeated invocations (parameter sweeps,
+# re-imports) don't keep growing sys.path with duplicate entries
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 
 def run_benchmark(force_save: bool = False):
+    # imported lazily so `import benchmark.main` as a library doesn't pay
+    # for the full sample-runs chain (plotting, solvers, config loading)
+    from benchmark.utils.config import load_config
+    from benchmark.utils.sample_runs import (
+        demo_run,
+        run_scaling_benchmark,
+        run_custom_graph,
+    )
+
     config, required_force_save = load_config(force_save=force_save)
 
     if config["demo_run"]:
@@ -1,136 +1,400 @@
 import math
 import heapq
+import numpy as np
 from collections import deque
 from typing import List, Tuple
 from benchmark.methods.base import BaseShortestPath
 from benchmark.datastructures.graph import Graph
 from benchmark.methods.BMSSP_utils.data_structures.BBLL import BBLL
+from benchmark.methods.BMSSP_utils.utils.kernels import (
+    NUMBA_AVAILABLE, base_case_expand, relax_frontier,
+)
+
+# fixed-point scale for packing distances into the int64 tie-break key
+KEY_SCALE = 2 ** 20
+KEY_INF = np.iinfo(np.int64).max
 
 class BMSSP(BaseShortestPath):
     def __init__(self, graph: Graph, source: int):
         super().__init__(graph, source)
 
-        self.reset_state()
-
-        for v in range(self.graph.node_count):
-            # ensure every node has an entry even if isolated
-            self.dist[v] = float('inf')
-            self.pred[v] = None
-
         if source >= self.graph.node_count:
             self.graph.node_count = max(self.graph.node_count, source + 1)
-            self.dist[source] = 0.0
-            self.pred[source] = -1
-        else:
-            self.dist[source] = 0.0
-            self.pred[source] = -1
+
+        # dist/pred as flat arrays: node ids are dense ints, so array indexing
+        # replaces dict hashing in the relaxation loops (pred -1 == no predecessor)
+        self.dist = np.full(self.graph.node_count, np.inf, dtype=np.float64)
+        self.pred = np.full(self.graph.node_count, -1, dtype=np.int64)
+        self.dist[source] = 0.0
+
+        # enables the O(|D|) structure checks inside the bmssp hot loop
+        self.debug = False
 
         self.k = math.floor(math.pow(math.log2(self.graph.node_count), 1/3))
         self.t = math.floor(math.pow(math.log2(self.graph.node_count), 2/3))
         self.max_iterations = self.graph.node_count
-        self.multiplier = math.pow(10, math.floor(math.log10(self.graph.node_count) + 1))
+
+        # top recursion level, computed once: ceil(log2(n) / t) via integer
+        # bit_length (ceil(ceil(x) / t) == ceil(x / t) for integer t > 0)
+        self.l0 = ((self.graph.node_count - 1).bit_length() + self.t - 1) // self.t
+
+        # integer lexicographic tie-break key: dist (fixed-point, 2^20 scale)
+        # packs above pred, pred above v, so int64 compares replace the old
+        # floating (dist + 1) * multiplier + pred + v / multiplier encoding
+        n = self.graph.node_count
+        self._scale = float(KEY_SCALE)
+        self._c2 = n
+        self._c1 = n * (n + 1)
+
+        self._build_csr()
+
+        # Clamp the fixed-point scale so the packed key can never wrap
+        # int64: any shortest path is bounded by (n - 1) * w_max, so the
+        # largest key is about dist_max * scale * c1. With the default
+        # 2^20 scale that wraps once dist_max * n^2 nears 8.8e12; halve
+        # the scale (power of two, floored at 1) until the bound fits,
+        # trading tie-break resolution for correct ordering.
+        if len(self.weights):
+            w_max = float(np.max(self.weights))
+            dist_max = max(w_max, 1.0) * max(n - 1, 1)
+            scale = KEY_SCALE
+            while scale > 1 and \
+                    (int(dist_max * scale) + 2) * self._c1 + n * self._c2 + n \
+                    >= KEY_INF:
+                scale //= 2
+            self._scale = float(scale)
+
+        # cached tie-break key per vertex, kept in sync with dist/pred
+        self.key = np.full(n, KEY_INF, dtype=np.int64)
+        self.key[source] = self._key_of(self.dist[source], self.pred[source], source)
+
+    def _key_of(self, d: float, pred: int, v: int) -> int:
+        """Pack (dist, pred, v) into one int64, ordered lexicographically."""
+        return int(d * self._scale + 0.5) * self._c1 + (pred + 1) * self._c2 + v
+
+    def _build_csr(self) -> None:
+        """Snapshot the adjacency into CSR arrays (indptr/indices/weights).
+
+        The relaxation loops touch every edge of the frontier per round;
+        contiguous arrays let them be gathered and relaxed with vectorized
+        NumPy ops instead of per-edge Python iteration.
+        """
+        n = self.graph.node_count
+        if hasattr(self.graph, "finalize"):
+            # the graph owns a CSR snapshot; share it instead of rebuilding
+            self.graph.finalize()
+            self.indptr = self.graph.indptr
+            self.indices = self.graph.indices
+            self.weights = self.graph.weights
+        else:
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            indices = []
+            weights = []
+            for u in range(n):
+                nbrs = self.graph.get_neighbors(u)
+                indptr[u + 1] = indptr[u] + len(nbrs)
+                for v, w in nbrs:
+                    indices.append(v)
+                    weights.append(w)
+
+            self.indptr = indptr
+            self.indices = np.asarray(indices, dtype=np.int64)
+            self.weights = np.asarray(weights, dtype=np.float64)
+
+        # scratch buffers for the jitted relaxation kernel
+        self._frontier_buf = np.empty(n, dtype=np.int64)
+        self._seen = np.zeros(n, dtype=np.uint8)
+
+        # scratch heap for the jitted base_case expansion (pushes are bounded
+        # by one per relaxed edge, plus the seed entry)
+        m = len(self.indices)
+        self._heap_d = np.empty(m + 1, dtype=np.float64)
+        self._heap_u = np.empty(m + 1, dtype=np.int64)
+        self._settled_buf = np.empty(self.k + 2, dtype=np.int64)
+
+        # find_pivots frontier state: membership bitmap + dense vertex list
+        # (O(1) add/contains without Python set hashing)
+        self._in_w = np.zeros(n, dtype=np.uint8)
+        self._w_buf = np.empty(n, dtype=np.int64)
+
+        # Dial-style bucket queue in base_case is valid when all weights are
+        # small positive integers (distances then advance in integer steps)
+        self._bucket_span = None
+        if len(self.weights) and np.all(self.weights == np.rint(self.weights)):
+            w_max = int(self.weights.max())
+            if 0 < w_max <= 4096:
+                self._bucket_span = w_max + 1
+
+    def _gather_edges(self, u_arr):
+        """Gather the outgoing edges of the frontier `u_arr` from the CSR.
+
+        Returns (src, dst, weight) arrays with one entry per edge.
+        """
+        counts = self.indptr[u_arr + 1] - self.indptr[u_arr]
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float64)
+
+        offsets = np.zeros(len(u_arr), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        edge_idx = np.repeat(self.indptr[u_arr] - offsets, counts) + np.arange(total)
+        src = np.repeat(u_arr, counts)
+        return src, self.indices[edge_idx], self.weights[edge_idx]
+
+    def _relax_frontier_numpy(self, u_arr, B):
+        """Sequential fallback for one relaxation round when numba is absent.
+
+        Mirrors the `relax_frontier` kernel edge for edge: `dist[u]` is read
+        when u's edges are scanned (so an improvement by an earlier frontier
+        member propagates within the same round) and ties among duplicate
+        targets resolve in the same scan order, so the two paths produce
+        identical dist/pred/key whether or not numba is installed.
+
+        Returns the newly improved vertices with key < B as an int64 array.
+        """
+        dist, pred, key = self.dist, self.pred, self.key
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        scale, c1, c2 = self._scale, self._c1, self._c2
+
+        out = []
+        seen = self._seen
+        for u in u_arr:
+            d_u = dist[u]
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                alt = d_u + weights[e]
+                alt_mult = np.int64(alt * scale + 0.5) * c1 + (u + 1) * c2 + v
+
+                if alt_mult <= key[v]:
+                    dist[v] = alt
+                    pred[v] = u
+                    key[v] = alt_mult
+
+                    if alt_mult < B and seen[v] == 0:
+                        seen[v] = 1
+                        out.append(v)
+
+        for v in out:
+            seen[v] = 0
+
+        return np.asarray(out, dtype=np.int64)
 
     def validate(self) -> bool:
         return True
-    
-    def setup(self) -> bool:
-        for v in range(self.graph.node_count):
-            # ensure every node has an entry even if isolated
-            self.dist[v] = float('inf')
-            self.pred[v] = None
 
+    def reset_state(self) -> None:
+        self.dist.fill(np.inf)
+        self.pred.fill(-1)
+        self.key.fill(KEY_INF)
+        self.edge_relaxations = 0
+        self.successful_relaxations = 0
+        self.iterations = 0
+
+    def distance(self, node: int) -> float:
+        if 0 <= node < len(self.dist):
+            return float(self.dist[node])
+        return math.inf
+
+    def path(self, node: int) -> List[int]:
+        """Reconstruct path from last run()'s source to `node`. Empty if unreachable."""
+        if self.source is None or not (0 <= node < len(self.dist)):
+            return []
+        if math.isinf(self.dist[node]):
+            return []
+
+        rev = []
+        cur = node
+        while cur != -1:
+            rev.append(cur)
+            cur = int(self.pred[cur])
+        rev.reverse()
+        if not rev or rev[0] != self.source:
+            return []
+        return rev
+
+    def setup(self) -> bool:
         if self.source >= self.graph.node_count:
             self.graph.node_count = max(self.graph.node_count, self.source + 1)
-            self.dist[self.source] = 0.0
-            self.pred[self.source] = -1
+
+        if len(self.dist) < self.graph.node_count:
+            self.dist = np.full(self.graph.node_count, np.inf, dtype=np.float64)
+            self.pred = np.full(self.graph.node_count, -1, dtype=np.int64)
+            self.key = np.full(self.graph.node_count, KEY_INF, dtype=np.int64)
         else:
-            self.dist[self.source] = 0.0
-            self.pred[self.source] = -1
+            self.reset_state()
+
+        self.dist[self.source] = 0.0
+        self.key[self.source] = self._key_of(self.dist[self.source], self.pred[self.source], self.source)
 
     def run(self) -> bool:
         if not self.validate():
             return False
 
-        l0 = math.ceil(math.log2(self.graph.node_count) / self.t)
-        B0 = float('inf')
+        l0 = self.l0
+        B0 = math.inf
         S0 = {self.source}
 
         B_prime, U = self.bmssp(l0, B0, S0)
 
-        return True    
+        return True
 
-    def find_pivots(self, B, S):
-        #print("--- FIND PIVOTS ---")
-        W = set(S)
-        W_prev = set(S)
-        #print(f"W = {W}, W_prev = {W_prev}, k = {self.k}")
+    def _build_reverse_csr(self) -> None:
+        """Build the reverse CSR (incoming edges) on first point-to-point query."""
+        if hasattr(self, "rev_indptr"):
+            return
+
+        n = self.graph.node_count
+        counts = np.zeros(n, dtype=np.int64)
+        np.add.at(counts, self.indices, 1)
+        self.rev_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.rev_indptr[1:])
+
+        # stable sort by destination groups the edges per target vertex
+        src = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        self.rev_indices = src[order]
+        self.rev_weights = self.weights[order]
+
+    def run_bidirectional(self, target: int) -> float:
+        """Point-to-point distance source -> target via bidirectional search.
+
+        Runs bounded Dijkstra forward on the CSR and backward on the reverse
+        CSR, settling the cheaper frontier each step and stopping once the two
+        radii together cannot beat the best meeting point. Does not touch the
+        dist/pred state of run().
+        """
+        if not (0 <= target < self.graph.node_count):
+            return math.inf
+        if target == self.source:
+            return 0.0
+
+        self._build_reverse_csr()
+        n = self.graph.node_count
+        dist_f = np.full(n, np.inf, dtype=np.float64)
+        dist_b = np.full(n, np.inf, dtype=np.float64)
+        dist_f[self.source] = 0.0
+        dist_b[target] = 0.0
+
+        heap_f: List[Tuple[float, int]] = [(0.0, self.source)]
+        heap_b: List[Tuple[float, int]] = [(0.0, target)]
+        done_f: set[int] = set()
+        done_b: set[int] = set()
+        best = math.inf
+
+        while heap_f and heap_b:
+            if heap_f[0][0] + heap_b[0][0] >= best:
+                break
 
-        # k relaxations
-        for _ in range(1, self.k + 1):
-            W_curr = set()
-            
-            for u in W_prev:
-                d_u = self.dist[u]
-                for v, w in self.graph.get_neighbors(u):
-                    alt = d_u + w
-                    alt_multiplied = (alt + 1) * self.multiplier + u + v / self.multiplier
-                    if self.dist[v] != float('inf'):
-                        d_v_multiplied = (self.dist[v] + 1) * self.multiplier + self.pred[v] + v / self.multiplier
-                    else:
-                        d_v_multiplied = float('inf')
+            # settle one vertex on the side with the smaller radius
+            forward = heap_f[0][0] <= heap_b[0][0]
+            heap = heap_f if forward else heap_b
+            dist = dist_f if forward else dist_b
+            other = dist_b if forward else dist_f
+            done = done_f if forward else done_b
+            indptr = self.indptr if forward else self.rev_indptr
+            indices = self.indices if forward else self.rev_indices
+            weights = self.weights if forward else self.rev_weights
 
-                    if alt_multiplied <= d_v_multiplied:
-                        self.dist[v] = alt
-                        self.pred[v] = u
+            d_u, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
 
-                        if alt_multiplied < B:
-                            W_curr.add(v)
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, w in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+                alt = d_u + w
+                if alt < dist[v]:
+                    dist[v] = alt
+                    heapq.heappush(heap, (alt, v))
+                if alt + other[v] < best:
+                    best = alt + other[v]
 
-            W |= W_curr
+        return best
 
-            if len(W) > self.k * len(S):
-                #print(f"W IS TOO LARGE")
-                #print(f"W = {W}")
-                return set(S), W
+    def find_pivots(self, B, S):
+        #print("--- FIND PIVOTS ---")
+        # W as membership bitmap + dense list: O(1) add/contains without
+        # Python set hashing; `in_w` is cleared again before every return
+        in_w = self._in_w
+        w_buf = self._w_buf
+        w_n = 0
+        for u in S:
+            if not in_w[u]:
+                in_w[u] = 1
+                w_buf[w_n] = u
+                w_n += 1
+
+        w_prev = w_buf[:w_n].copy()
+
+        # k relaxations, one pass over the frontier's edges per round
+        for _ in range(1, self.k + 1):
+            w_curr = np.empty(0, dtype=np.int64)
+
+            if len(w_prev):
+                if NUMBA_AVAILABLE:
+                    n_new = relax_frontier(
+                        self.indptr, self.indices, self.weights,
+                        self.dist, self.pred, self.key, w_prev, B,
+                        self._scale, self._c1, self._c2,
+                        self._frontier_buf, self._seen)
+                    w_curr = self._frontier_buf[:n_new].copy()
+                else:
+                    w_curr = self._relax_frontier_numpy(w_prev, B)
 
-            W_prev = W_curr
+            if len(w_curr):
+                fresh = w_curr[in_w[w_curr] == 0]
+                in_w[fresh] = 1
+                w_buf[w_n:w_n + len(fresh)] = fresh
+                w_n += len(fresh)
 
-            #print(f"W = {W}, W_prev = {W_prev}")
+            if w_n > self.k * len(S):
+                #print(f"W IS TOO LARGE")
+                W = set(w_buf[:w_n].tolist())
+                in_w[w_buf[:w_n]] = 0
+                return set(S), W
 
-        # Build forest F
-        children = {u: [] for u in W}
+            w_prev = w_curr
 
-        for u in W:
-            d_u = self.dist[u]
-            for v, w in self.graph.get_neighbors(u):
-                if v in W and self.dist[v] == d_u + w:
-                    children[u].append(v)
+        w_list = w_buf[:w_n].tolist()
 
-        # Roots = nodes with no parent
-        has_parent = set()
-        for u in children:
-            for v in children[u]:
-                has_parent.add(v)
+        # Build forest F from the recorded parents: pred[v] is the relaxation
+        # winner, so no second sweep over the frontier's edges is needed
+        children = {u: [] for u in w_list}
+        roots = []
 
-        roots = [u for u in W if u not in has_parent]
+        for v in w_list:
+            p = int(self.pred[v])
+            if p >= 0 and in_w[p]:
+                children[p].append(v)
+            else:
+                roots.append(v)
 
-        # Compute subtree sizes
+        # Compute subtree sizes in a single memoized DFS instead of one BFS
+        # per root: size[x] = 1 + sum(size[c]), shared across all roots
         subtree_size = {}
 
         for r in roots:
-            size = 0
-            q = deque([r])
-            while q:
-                x = q.popleft()
-                size += 1
-                for ch in children[x]:
-                    q.append(ch)
-            subtree_size[r] = size
-
-        # P = roots in S that have subtree ≥ k
-        P = {u for u in S if u in subtree_size and subtree_size[u] >= self.k}
-
-        return set(P), W
+            if r in subtree_size:
+                continue
+            stack = [r]
+            while stack:
+                x = stack[-1]
+                unresolved = [c for c in children[x] if c not in subtree_size]
+                if unresolved:
+                    stack.extend(unresolved)
+                else:
+                    stack.pop()
+                    subtree_size[x] = 1 + sum(subtree_size[c] for c in children[x])
+
+        # P = roots in S that have subtree ≥ k; the memoized DFS fills
+        # subtree_size for every vertex in W, so root membership has to be
+        # checked explicitly
+        root_set = set(roots)
+        P = {u for u in S if u in root_set and subtree_size[u] >= self.k}
+
+        in_w[w_buf[:w_n]] = 0
+        return set(P), set(w_list)
     
     def base_case(self, B, S):
         # S must be a singleton {x}
@@ -141,40 +405,92 @@ class BMSSP(BaseShortestPath):
 
         # U0 starts as S
         U0 = set(S)
-
-        # Min-heap for Dijkstra
-        heap: List[Tuple[float, int]] = [(self.dist[x], x)]
         visited = set()
 
-        while heap and len(U0) < self.k + 1:
-            d_u, u = heapq.heappop(heap)
-            if d_u > self.dist[u] or u in visited:
-                continue
-            
-            visited.add(u)
-            U0.add(u)
+        if NUMBA_AVAILABLE and self.k >= 1 and not math.isinf(self.dist[x]):
+            # whole pop/relax loop in compiled code; pop order and bound
+            # checks match the interpreted branches, so results are identical
+            n_set = base_case_expand(
+                self.indptr, self.indices, self.weights,
+                self.dist, self.pred, self.key, x, B, self.k,
+                self._scale, self._c1, self._c2,
+                self._heap_d, self._heap_u, self._settled_buf, self._seen)
+            U0.update(self._settled_buf[:n_set].tolist())
+        elif self._bucket_span is not None and not math.isinf(self.dist[x]):
+            # Dial's algorithm: circular bucket queue over the integer
+            # distances; active entries always span at most w_max + 1 values,
+            # so d mod span is collision-free
+            span = self._bucket_span
+            buckets: List[List[Tuple[float, int]]] = [[] for _ in range(span)]
+            cur = int(self.dist[x])
+            buckets[cur % span].append((self.dist[x], x))
+            n_entries = 1
+
+            while n_entries and len(U0) < self.k + 1:
+                slot = buckets[cur % span]
+                if not slot:
+                    cur += 1
+                    continue
+
+                # within a bucket all entries share d == cur; sorting gives
+                # the same (d, u) pop order the heap would
+                slot.sort()
+                idx = 0
+                while idx < len(slot) and len(U0) < self.k + 1:
+                    d_u, u = slot[idx]
+                    idx += 1
+                    n_entries -= 1
+                    if d_u > self.dist[u] or u in visited:
+                        continue
+
+                    visited.add(u)
+                    U0.add(u)
+
+                    lo, hi = self.indptr[u], self.indptr[u + 1]
+                    for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist()):
+                        alt = d_u + w
+                        alt_multiplied = self._key_of(alt, u, v)
+
+                        if alt_multiplied <= self.key[v] and alt_multiplied < B:
+                            self.dist[v] = alt
+                            self.pred[v] = u
+                            self.key[v] = alt_multiplied
+                            buckets[int(alt) % span].append((alt, v))
+                            n_entries += 1
+
+                del slot[:idx]
+        else:
+            # Min-heap for Dijkstra (general weights)
+            heap: List[Tuple[float, int]] = [(self.dist[x], x)]
 
-            # relax neighbors
-            for v, w in self.graph.get_neighbors(u):
-                alt = d_u + w
-                alt_multiplied = (alt + 1) * self.multiplier + u + v / self.multiplier
-                if self.dist[v] != float('inf'):
-                    d_v_multiplied = (self.dist[v] + 1) * self.multiplier + self.pred[v] + v / self.multiplier
-                else:
-                    d_v_multiplied = float('inf')
+            while heap and len(U0) < self.k + 1:
+                d_u, u = heapq.heappop(heap)
+                if d_u > self.dist[u] or u in visited:
+                    continue
 
-                if alt_multiplied <= d_v_multiplied and alt_multiplied < B:
-                    self.dist[v] = alt
-                    self.pred[v] = u
-                    heapq.heappush(heap, (alt, v))
+                visited.add(u)
+                U0.add(u)
+
+                # relax neighbors via the CSR slice (no adjacency-dict lookup
+                # or per-edge tuple allocation)
+                lo, hi = self.indptr[u], self.indptr[u + 1]
+                for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist()):
+                    alt = d_u + w
+                    alt_multiplied = self._key_of(alt, u, v)
+
+                    if alt_multiplied <= self.key[v] and alt_multiplied < B:
+                        self.dist[v] = alt
+                        self.pred[v] = u
+                        self.key[v] = alt_multiplied
+                        heapq.heappush(heap, (alt, v))
 
         # If U0 has at most k vertices → trivial case
         if len(U0) <= self.k:
             return B, U0
 
         # Else choose new boundary B'
-        B_prime = max((self.dist[v] + 1) * self.multiplier + self.pred[v] + v / self.multiplier for v in U0) 
-        U = {v for v in U0 if (self.dist[v] + 1) * self.multiplier + self.pred[v] + v / self.multiplier < B_prime}
+        B_prime = max(self.key[v] for v in U0)
+        U = {v for v in U0 if self.key[v] < B_prime}
 
         return B_prime, U
 
@@ -211,15 +527,16 @@ class BMSSP(BaseShortestPath):
 
         # Insert all pivots
         for x in P:
-            D.insert(x, (self.dist[x] + 1) * self.multiplier + self.pred[x] + x / self.multiplier)
-            D._check_invariants()
+            D.insert(x, self.key[x])
+            if self.debug:
+                D._check_invariants()
 
         #D.traverse()
 
-        if P:
-            B_prime_agg = min((self.dist[x] + 1) * self.multiplier + self.pred[x] + x / self.multiplier for x in P)
-        else:
-            B_prime_agg = B
+        # B' of the most recent sub-call: on early exit (workload threshold)
+        # everything below it is complete; on successful exit (D exhausted)
+        # the whole [*, B) range is complete and B' is B itself
+        last_B_prime = B
 
         U: set[int] = set()
         U_threshold = self.k * math.pow(2, l * self.t)
@@ -233,13 +550,14 @@ class BMSSP(BaseShortestPath):
             #D.traverse()
             Si, Bi = D.pull()
             #D.traverse()
-            D._check_invariants()
+            if self.debug:
+                D._check_invariants()
             if len(Si) == 0:
                 break
             #print(f"k = {self.k}, t = {self.t}, U_threshold = {U_threshold}")
             #print(f"Si = {Si}, Bi = {Bi}")
             Bi_prime, Ui = self.bmssp(l - 1, Bi, Si)
-            B_prime_agg = min(B_prime_agg, Bi_prime)
+            last_B_prime = Bi_prime
 
             U |= Ui
             #print(f"U = {U}, Bi_prime = {Bi_prime}, Ui = {Ui}")
@@ -250,41 +568,48 @@ class BMSSP(BaseShortestPath):
 
             for u in Ui:
                 d_u = self.dist[u]
-                for v, w in self.graph.get_neighbors(u):
+                lo, hi = self.indptr[u], self.indptr[u + 1]
+                for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist()):
                     alt = d_u + w
-                    alt_multiplied = (alt + 1) * self.multiplier + u + v / self.multiplier
-                    if self.dist[v] != float('inf'):
-                        d_v_multiplied = (self.dist[v] + 1) * self.multiplier + self.pred[v] + v / self.multiplier
-                    else:
-                        d_v_multiplied = float('inf')
+                    alt_multiplied = self._key_of(alt, u, v)
 
-                    if alt_multiplied <= d_v_multiplied:
+                    if alt_multiplied <= self.key[v]:
                         self.dist[v] = alt
                         self.pred[v] = u
+                        self.key[v] = alt_multiplied
 
                         #print(f"v = {v}, alt = {alt}, B = {B}, Bi = {Bi}, Bi_prime = {Bi_prime}")
 
                         if Bi <= alt_multiplied < B:
                             D.insert(v, alt_multiplied)
-                            D._check_invariants()
+                            if self.debug:
+                                D._check_invariants()
                             #D.traverse()
                         elif Bi_prime <= alt_multiplied < Bi:
                             K.add((v, alt_multiplied))
 
             prepend_records: set[tuple[int, float]] = K.copy()
             for x in Si:
-                d_x_multiplied = (self.dist[x] + 1) * self.multiplier + self.pred[x] + x / self.multiplier
+                d_x_multiplied = self.key[x]
                 if Bi_prime <= d_x_multiplied < Bi:
                     prepend_records.add((x, d_x_multiplied))
 
-            D.batch_prepend(prepend_records)
-            D._check_invariants()
+            # pre-sort by (val, vertex): batch_prepend then slices blocks off
+            # an already-ordered run instead of re-sorting
+            D.batch_prepend(sorted(prepend_records, key=lambda r: (r[1], r[0])))
+            if self.debug:
+                D._check_invariants()
             #D.traverse()
 
-        B_prime = min(B_prime_agg, B)
+        if len(U) >= U_threshold or iteration >= self.max_iterations:
+            # partial run: only the last sub-call's bound is certified
+            B_prime = min(last_B_prime, B)
+        else:
+            # D exhausted: every vertex below B is complete
+            B_prime = B
         U_final = set(U)
         for x in W:
-            if (self.dist[x] + 1) * self.multiplier + self.pred[x] + x / self.multiplier < B_prime:
+            if self.key[x] < B_prime:
                 U_final.add(x)
 
         if iteration >= self.max_iterations:
@@ -292,10 +617,12 @@ class BMSSP(BaseShortestPath):
             visited = set(U_final)
             while queue:
                 u = queue.popleft()
-                for v, w in self.graph.get_neighbors(u):
+                lo, hi = self.indptr[u], self.indptr[u + 1]
+                for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist()):
                     if self.dist[u] + w < self.dist[v]:
                         self.dist[v] = self.dist[u] + w
                         self.pred[v] = u
+                        self.key[v] = self._key_of(self.dist[v], u, v)
                     if v not in visited:
                         visited.add(v)
                         queue.append(v)
@@ -304,155 +631,3 @@ class BMSSP(BaseShortestPath):
 
         #print(f"U_final = {U_final}")
         return B_prime, U_final
-
-# ---------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------
-
-def build_chain_graph():
-    """
-    Graph A:
-      0 -> 1 (2)
-      1 -== 2 (3)
-      2 -> 3 (4)
-    """
-    g = Graph(directed=True)
-    g.node_count = 4
-    g.add_edge(0, 1, 2)
-    g.add_edge(1, 2, 3)
-    g.add_edge(2, 3, 4)
-    return g, 0  # graph, source
-
-
-def build_tree_graph():
-    """
-    Graph B (tree):
-           0
-         / | \
-        1  2  3
-        |
-        4
-    All weights = 1.
-    """
-    g = Graph(directed=True)
-    g.node_count = 5
-    g.add_edge(0, 1, 1)
-    g.add_edge(0, 2, 1)
-    g.add_edge(0, 3, 1)
-    g.add_edge(1, 4, 1)
-    return g, 0
-
-
-def build_cycle_graph():
-    """
-    Graph C (cycle):
-      0 -> 1 -== 2 -> 0
-    All weights = 1.
-    """
-    g = Graph(directed=True)
-    g.node_count = 3
-
-    g.add_edge(0, 1, 1)
-    g.add_edge(1, 2, 1)
-    g.add_edge(2, 0, 1)
-    return g, 0
-
-
-def build_paper_like_graph():
-    """
-    Graph D: a slightly richer DAG to see pivots / recursion.
-      0 -> 1 (1)
-      1 -== 2 (1)
-      1 -> 3 (2)
-      0 -> 4 (3)
-      4 -> 5 (1)
-    """
-    g = Graph(directed=True)
-    g.node_count = 6
-
-    g.add_edge(0, 1, 1)
-    g.add_edge(1, 2, 1)
-    g.add_edge(1, 3, 2)
-    g.add_edge(0, 4, 3)
-    g.add_edge(4, 5, 1)
-    return g, 0
-
-
-def build_medium_graph(n=11, avg_outdegree=2):
-    """
-    Builds a sparse directed graph with ~n nodes and outdegree ≈ avg_outdegree.
-    Graph is guaranteed source-connected.
-    """
-    import random
-    random.seed(0)
-
-    g = Graph(directed=True)
-    g.node_count = n
-
-    # Always connect linearly to ensure connectivity
-    for u in range(n - 1):
-        g.add_edge(u, u + 1, 1)
-
-    # Add sparse random edges
-    extra_edges = int(n * avg_outdegree)
-
-    for _ in range(extra_edges):
-        u = random.randint(0, n - 2)
-        v = random.randint(u + 1, min(n - 1, u + random.randint(2, 50)))
-        w = random.randint(1, 10)
-        g.add_edge(u, v, w)
-
-    # Add occasional backward edges — optional (small cycles)
-    for _ in range(extra_edges // 10):
-        u = random.randint(10, n - 1)
-        v = random.randint(0, u - 1)
-        g.add_edge(u, v, random.randint(1, 10))
-
-    return g, 0
-
-
-def print_graph(g: Graph):
-    print("Graph edges:")
-    for u in range(g.node_count):
-        for v, w in g.get_neighbors(u):
-            print(f"  {u} -> {v} (w={w})")
-
-
-def run_bmssp_on_graph(name: str, graph_builder):
-    print("\n" + "=" * 60)
-    print(f" DEMO: {name}")
-    print("=" * 60)
-
-    g, source = graph_builder()
-    print(f"Source: {source}")
-    print_graph(g)
-
-    # Initialize BMSSP
-    bm = BMSSP(g, source)
-
-    # Let run() do whatever initialization it currently does
-    bm.run()
-
-    print("\nDistances:")
-    for i in range(g.node_count):
-        print(f"  dist[{i}] = {bm.dist[i]}")
-
-    print("\nPredecessors:")
-    for i in range(g.node_count):
-        print(f"  pred[{i}] = {bm.pred[i]}")
-
-    print("=" * 60)
-    print()
-
-
-def main():
-    # Run all four demos
-    run_bmssp_on_graph("A: Simple Chain 0→1→2→3", build_chain_graph)
-    run_bmssp_on_graph("B: Tree 0 with children and a leaf path", build_tree_graph)
-    run_bmssp_on_graph("C: Cycle 0→1→2→0", build_cycle_graph)
-    run_bmssp_on_graph("D: Paper-like Small DAG", build_paper_like_graph)
-    run_bmssp_on_graph("E: Medium Space Graph (2000 nodes)", build_medium_graph)
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
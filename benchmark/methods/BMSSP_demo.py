@@ -0,0 +1,157 @@
+"""Demo graphs and a small CLI driver for the BMSSP implementation.
+
+Kept out of BMSSP.py so importing the algorithm does not pull in the
+demo machinery; run with `python -m benchmark.methods.BMSSP_demo`.
+"""
+
+from benchmark.datastructures.graph import Graph
+from benchmark.methods.BMSSP import BMSSP
+
+
+def build_chain_graph():
+    """
+    Graph A:
+      0 -> 1 (2)
+      1 -== 2 (3)
+      2 -> 3 (4)
+    """
+    g = Graph(directed=True)
+    g.node_count = 4
+    g.add_edge(0, 1, 2)
+    g.add_edge(1, 2, 3)
+    g.add_edge(2, 3, 4)
+    return g, 0  # graph, source
+
+
+def build_tree_graph():
+    """
+    Graph B (tree):
+           0
+         / | \
+        1  2  3
+        |
+        4
+    All weights = 1.
+    """
+    g = Graph(directed=True)
+    g.node_count = 5
+    g.add_edge(0, 1, 1)
+    g.add_edge(0, 2, 1)
+    g.add_edge(0, 3, 1)
+    g.add_edge(1, 4, 1)
+    return g, 0
+
+
+def build_cycle_graph():
+    """
+    Graph C (cycle):
+      0 -> 1 -== 2 -> 0
+    All weights = 1.
+    """
+    g = Graph(directed=True)
+    g.node_count = 3
+
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 1)
+    g.add_edge(2, 0, 1)
+    return g, 0
+
+
+def build_paper_like_graph():
+    """
+    Graph D: a slightly richer DAG to see pivots / recursion.
+      0 -> 1 (1)
+      1 -== 2 (1)
+      1 -> 3 (2)
+      0 -> 4 (3)
+      4 -> 5 (1)
+    """
+    g = Graph(directed=True)
+    g.node_count = 6
+
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 1)
+    g.add_edge(1, 3, 2)
+    g.add_edge(0, 4, 3)
+    g.add_edge(4, 5, 1)
+    return g, 0
+
+
+def build_medium_graph(n=11, avg_outdegree=2):
+    """
+    Builds a sparse directed graph with ~n nodes and outdegree ≈ avg_outdegree.
+    Graph is guaranteed source-connected.
+    """
+    import random
+    random.seed(0)
+
+    g = Graph(directed=True)
+    g.node_count = n
+
+    # Always connect linearly to ensure connectivity
+    for u in range(n - 1):
+        g.add_edge(u, u + 1, 1)
+
+    # Add sparse random edges
+    extra_edges = int(n * avg_outdegree)
+
+    for _ in range(extra_edges):
+        u = random.randint(0, n - 2)
+        v = random.randint(u + 1, min(n - 1, u + random.randint(2, 50)))
+        w = random.randint(1, 10)
+        g.add_edge(u, v, w)
+
+    # Add occasional backward edges — optional (small cycles)
+    for _ in range(extra_edges // 10):
+        u = random.randint(10, n - 1)
+        v = random.randint(0, u - 1)
+        g.add_edge(u, v, random.randint(1, 10))
+
+    return g, 0
+
+
+def print_graph(g: Graph):
+    print("Graph edges:")
+    for u in range(g.node_count):
+        for v, w in g.get_neighbors(u):
+            print(f"  {u} -> {v} (w={w})")
+
+
+def run_bmssp_on_graph(name: str, graph_builder):
+    print("\n" + "=" * 60)
+    print(f" DEMO: {name}")
+    print("=" * 60)
+
+    g, source = graph_builder()
+    print(f"Source: {source}")
+    print_graph(g)
+
+    # Initialize BMSSP
+    bm = BMSSP(g, source)
+
+    # Let run() do whatever initialization it currently does
+    bm.run()
+
+    print("\nDistances:")
+    for i in range(g.node_count):
+        print(f"  dist[{i}] = {bm.dist[i]}")
+
+    print("\nPredecessors:")
+    for i in range(g.node_count):
+        print(f"  pred[{i}] = {bm.pred[i]}")
+
+    print("=" * 60)
+    print()
+
+
+def main():
+    # Run all four demos
+    run_bmssp_on_graph("A: Simple Chain 0→1→2→3", build_chain_graph)
+    run_bmssp_on_graph("B: Tree 0 with children and a leaf path", build_tree_graph)
+    run_bmssp_on_graph("C: Cycle 0→1→2→0", build_cycle_graph)
+    run_bmssp_on_graph("D: Paper-like Small DAG", build_paper_like_graph)
+    run_bmssp_on_graph("E: Medium Space Graph (2000 nodes)", build_medium_graph)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
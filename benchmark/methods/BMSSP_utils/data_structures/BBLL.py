@@ -1,7 +1,12 @@
+import math
 from benchmark.methods.BMSSP_utils.data_structures.Block import Block, BNode
-from benchmark.methods.BMSSP_utils.data_structures.RBT import RedBlackTree
-from benchmark.methods.BMSSP_utils.utils.MedianFinder import MedianFinder
-import random, math
+from benchmark.methods.BMSSP_utils.data_structures.SortedBoundSet import SortedBoundSet
+import numpy as np
+
+# Diagnostic output (warning prints, traverse dumps) is compiled out of the
+# hot paths unless this is flipped on.
+_DEBUG = False
+
 
 # Block-Based Linked List (BBLL)
 class BBLL:
@@ -11,95 +16,61 @@ class BBLL:
 
         # D0: for batch prepends
         self.D0 = {}
-        self.D0_bounds = RedBlackTree()
+        self.D0_bounds = SortedBoundSet()
 
         # D1: maintains elements from insert operations
-        self.D1 = {self.B: Block()}
+        sentinel = Block()
+        sentinel.bound = self.B
+        self.D1 = {self.B: sentinel}
         
         # RB tree maintains upper bounds for D1
-        self.D1_bounds = RedBlackTree()
+        self.D1_bounds = SortedBoundSet()
         self.D1_bounds.insert(self.B)
 
         self.M = M  # maximum block size
-        self.nodes = [BNode(v, float('inf')) for v in range(N)]
+        INF = math.inf
+        self.nodes = [BNode(v, INF) for v in range(N)]
 
-        #print("NEW D")
-        #print(B)
-        #print(self.B)
-        #self.traverse()
 
     def delete(self, key, val):
         """Delete key/value pair."""
-        #print("DELETE FROM D")
-        #print(f"key = {key}, val = {val}")
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
-
-        D0_max_bound_node = self.D0_bounds._find_max(self.D0_bounds.root)
-        if D0_max_bound_node is not None and val < D0_max_bound_node.value:
-            bound = self.D0_bounds.search_bound(val)
-            if bound is None:
-                bound = D0_max_bound_node.value
-                
-            if bound is None or bound not in self.D0:
-                self.D0_bounds._inorder_traversal_values()
-                #self.traverse()
-                print(f"[Warning] D0: bound {bound} not found for value {val}.")
-                #print(self.D0_bounds._inorder_traversal_values())
-                #self.traverse()
-                return
-
-            block = self.D0[bound]
-            node = self.nodes[key]
-            block.delete(node)
 
-            # Delete the block if empty
-            if block.is_empty():
-                del self.D0[bound]
-                self.D0_bounds.delete(bound)
+        node = self.nodes[key]
 
-            #print(self.D0_bounds._inorder_traversal_values())
-            #self.traverse()
+        # The node's back-reference is authoritative: the same value range
+        # can exist in both D0 and D1, so locating the block by bound order
+        # would only be a guess.
+        block = node.block
+        if block is None:
             return
 
-        # pair is in D1
-        bound = self.D1_bounds.search_bound(val)
-        if bound is None:
-            max_node = self.D1_bounds._find_max(self.D1_bounds.root)
-            bound = max_node.value if max_node is not None else None
+        bound = block.bound
+        block.delete(node)
+        # reset so a later insert of this key is treated as absent, not as a
+        # failed improvement on the stale value
+        node.val = math.inf
 
-        if bound is None or bound not in self.D1:
-            print(f"[Warning] D1: bound {bound} not found for value {val}.")
-            #print(self.D0_bounds._inorder_traversal_values())
-            #self.traverse()
+        if not block.is_empty():
             return
 
-        block = self.D1[bound]
-        node = self.nodes[key]
-        block.delete(node)
-
-        # Only delete the bound if it's not the sentinel
-        if block.is_empty() and bound != self.B:
+        # Drop the emptied block from whichever side it is filed on
+        # (the D1 sentinel at B stays)
+        if self.D0.get(bound) is block:
+            del self.D0[bound]
+            self.D0_bounds.delete(bound)
+        elif bound != self.B and self.D1.get(bound) is block:
             del self.D1[bound]
             self.D1_bounds.delete(bound)
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
     def insert(self, key, new_val):
         """Insert or update a key/value pair."""
         node = self.nodes[key]
         old_val = node.val
 
-        #print("INSERT TO D")
-        #print(f"key = {key}, new_val = {new_val}, old_val = {old_val}")
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
         # Only improve
         if new_val >= old_val:
-            #print(self.D0_bounds._inorder_traversal_values())
-            #self.traverse()
             return
 
         # Remove from old block if present
@@ -121,18 +92,12 @@ class BBLL:
         if block.get_size() > self.M:
             self.split(block, bound)
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
     def split(self, block, old_bound):
         """
         Split a block into two when its size exceeds M.
         Uses the Block.find_median() function (O(M) expected time).
         """
-        #print("SPLIT IN D")
-        #print(f"block = {block}, old_bound = {old_bound}")
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
         if block.is_empty():
             return
@@ -157,6 +122,15 @@ class BBLL:
             if current_node == block.head:
                 break
 
+        # All values equal: a median split cannot separate them. Keep the
+        # nodes as one (oversized) block under the old bound — registering
+        # an empty block would poison find_global_min's prefix scan.
+        if left_block.is_empty() or right_block.is_empty():
+            survivor = right_block if left_block.is_empty() else left_block
+            survivor.bound = old_bound
+            self.D1[old_bound] = survivor
+            return
+
         # Step 3: Update D1 and bounds
         # Remove old bound from D1 and RedBlackTree
         del self.D1[old_bound]
@@ -172,54 +146,54 @@ class BBLL:
         if old_bound != self.B:
             self.D1_bounds.insert(right_bound)
         self.D1[left_bound] = left_block
+        left_block.bound = left_bound
         self.D1[right_bound] = right_block
+        right_block.bound = right_bound
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
     def batch_prepend(self, L):
         """
         BatchPrepend(L):
         If len(L) ≤ M → one new block at the start of D0.
-        Else → recursively split L using medians into O(L/M) blocks, 
-        each with ≤ ceil(M/2) elements.
-        Time: O(L log(L/M)).
+        Else → sort L once and cut it into O(L/M) contiguous blocks of up
+        to M elements; a cut never lands inside a run of equal values, so
+        a block can exceed M by the tail of the run it absorbs.
+        Time: O(L log L).
         """
-        #print("BATCH_PREPEND IN D")
-        #print(f"L = {L}")
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
         
         n = len(L)
         if n == 0:
-            #print(self.D0_bounds._inorder_traversal_values())
-            #self.traverse()
             return
         
         L_nodes = list()
         for (v, d_v) in L:
-            self.nodes[v].val = d_v
-            L_nodes.append(self.nodes[v])
-
-        def recursive_partition(nodes):
-            """Recursively partition arr into blocks of size ≤ ceil(M/2)."""
-            if len(nodes) <= self.M:
-                sorted_nodes = sorted(nodes, key=lambda node: node.val)
-                block = Block()
-                for node in sorted_nodes:
-                    block.insert(node)
-                return [block]
-
-            # Find median and split around it
-            median_value = MedianFinder.find_median([node.val for node in nodes])
-            left = [x for x in nodes if x.val < median_value]
-            right = [x for x in nodes if x.val >= median_value]
-
-            # Recursively build smaller blocks
-            return recursive_partition(left) + recursive_partition(right)
-
-        # Step 1: Split L into multiple blocks
-        blocks = recursive_partition(L_nodes)
+            node = self.nodes[v]
+            # unlink from any current block before mutating the value, else
+            # that block's bookkeeping goes stale
+            if node.next is not None:
+                self.delete(v, node.val)
+            node.val = d_v
+            L_nodes.append(node)
+
+        # Step 1: Split L into multiple blocks. One global sort (cheap when
+        # the caller already hands the records over pre-sorted) lets the
+        # blocks be cut as contiguous slices instead of recursive median
+        # partitioning; equal values are kept together so no value run
+        # straddles a block bound.
+        L_nodes.sort(key=lambda node: node.val)
+
+        blocks = []
+        i = 0
+        while i < n:
+            j = min(i + self.M, n)
+            while j < n and L_nodes[j].val == L_nodes[j - 1].val:
+                j += 1
+
+            block = Block()
+            for node in L_nodes[i:j]:
+                block.insert(node)
+            blocks.append(block)
+            i = j
 
         # Step 2: Prepend blocks to D0
         # Each block gets an upper bound equal to min value of the next block
@@ -228,12 +202,19 @@ class BBLL:
                 bound = self.find_global_min()
             else:
                 bound = blocks[i + 1].get_min()
-            
-            self.D0[bound] = blocks[i]
-            self.D0_bounds.insert(bound)
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
+            existing = self.D0.get(bound)
+            if existing is not None:
+                # a block is already filed under this bound (e.g. the old
+                # global min from an earlier prepend) — merge into it rather
+                # than overwriting the dict entry and stranding its nodes
+                for node in list(blocks[i].iterate()):
+                    existing.insert(node)
+            else:
+                self.D0[bound] = blocks[i]
+                blocks[i].bound = bound
+                self.D0_bounds.insert(bound)
+
 
     def pull(self):
         """
@@ -245,18 +226,15 @@ class BBLL:
         """
         M = self.M
 
-        #print("PULL FROM D")
-        #print(f"M = {M}")
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
 
         # -------------------------------
         # Step 1: Collect prefix blocks: S′0 from D0, S′1 from D1
         # -------------------------------
-        S0 = self.collect_from_D0(M)
-        S1 = self.collect_from_D1(M)
-
-        S_all = S0 + S1       # raw elements
+        # both collections append into one list (up to M each), so there is
+        # no intermediate concat or copy before selection
+        S_all = []
+        self._collect_prefix(self.D0_bounds, self.D0, M, S_all)
+        self._collect_prefix(self.D1_bounds, self.D1, len(S_all) + M, S_all)
         total = len(S_all)
 
         # -------------------------------
@@ -268,46 +246,20 @@ class BBLL:
                 self.delete(key, val)
 
             S_set = {key for (key, val) in S_all}
-            #print(self.D0_bounds._inorder_traversal_values())
-            #self.traverse()
             return S_set, self.B
 
         # -------------------------------
         # Case 2: Need exactly M smallest values from S_all
         # -------------------------------
-        # Extract M smallest values in O(M) expected time using Quickselect
-        values = [(key, val) for key, val in S_all]
-
-        # quickselect helper
-        def quickselect(arr, k, key=lambda x: x[1]):
-            if len(arr) == 1:
-                return arr[0]
-            pivot = random.choice(arr)
-            pv = key(pivot)
-            lows = [x for x in arr if key(x) < pv]
-            highs = [x for x in arr if key(x) > pv]
-            pivots = [x for x in arr if key(x) == pv]
-
-            if k < len(lows):
-                return quickselect(lows, k, key)
-            elif k < len(lows) + len(pivots):
-                return pivots[0]
-            else:
-                return quickselect(highs, k - len(lows) - len(pivots), key)
-
-        # find threshold value (M-th smallest)
-        threshold_pair = quickselect(values, M-1, key=lambda x: x[1])
-        threshold_val = threshold_pair[1]
+        # Select the M smallest in O(total) via numpy's introselect:
+        # argpartition gives the winning indices in one C call, replacing
+        # the old threshold scan plus two filtering passes.
+        # np.asarray keeps integer values in exact int64.
+        vals = np.asarray([val for _, val in S_all])
+        idx = np.argpartition(vals, M - 1)[:M]
 
         # build S′ = M smallest elements
-        # (stable, because each block keeps elements ≤ M)
-        S_prime = [pair for pair in values if pair[1] < threshold_val]
-
-        # fill remaining equal-to-threshold if needed
-        if len(S_prime) < M:
-            needed = M - len(S_prime)
-            equal_vals = [pair for pair in values if pair[1] == threshold_val]
-            S_prime.extend(equal_vals[:needed])
+        S_prime = [S_all[i] for i in idx.tolist()]
 
         # -------------------------------
         # Step 3: Delete S′ from D0 and D1
@@ -317,49 +269,30 @@ class BBLL:
 
         S_set = {key for (key, val) in S_prime}
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
   
         return S_set, self.find_global_min()
     
-    def collect_from_D0(self, M):
-        """Collect up to M values from prefix blocks in D0."""
-        result = []
-        inorder_bounds = self.D0_bounds._inorder_traversal_values()
-
-        for bound in inorder_bounds:
-            block = self.D0[bound]
-            for node in block.iterate():
-                result.append((node.key, node.val))
-                if len(result) >= M:
-                    return result
-        return result
-    
-    def collect_from_D1(self, M):
-        """Collect up to M values from prefix blocks in D1."""
-        result = []
-        inorder_bounds = self.D1_bounds._inorder_traversal_values()
-
-        for bound in inorder_bounds:
-            block = self.D1[bound]
-            for node in block.iterate():
-                result.append((node.key, node.val))
-                if len(result) >= M:
-                    return result
-        return result
-    
+    def _collect_prefix(self, bounds, D, limit, out):
+        """Append (key, val) pairs from prefix blocks to `out` until it
+        holds at least `limit` entries.
+
+        Only whole blocks are taken: nodes inside a block are not sorted,
+        so cutting off mid-block could keep a block's large values while
+        dropping its small ones."""
+        for bound in bounds.iter_inorder():
+            if len(out) >= limit:
+                return
+            for node in D[bound].iterate():
+                out.append((node.key, node.val))
+
     def find_global_min(self):
         """Return the smallest value in D0 ∪ D1 in O(M) time."""
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
         candidate = self.B
 
         # Check D0's smallest bound
         if self.D0_bounds.root is not None:
             min_bound_node = self.D0_bounds._find_min(self.D0_bounds.root)
             if min_bound_node is not None:
-                #print(self.D0_bounds._inorder_traversal_values())
-                #self.traverse()
                 block = self.D0[min_bound_node.value]
                 if not block.is_empty():
                     potential = block.get_min()
@@ -376,12 +309,12 @@ class BBLL:
                     if potential < candidate:
                         candidate = potential
 
-        #print(self.D0_bounds._inorder_traversal_values())
-        #self.traverse()
         return candidate
 
     def traverse(self):
-        """Pretty-#print the structure of D0 and D1 in a clean, readable format."""
+        """Pretty-print the structure of D0 and D1 (debug builds only)."""
+        if not _DEBUG:
+            return
 
         def format_block(block):
             if block is None or block.is_empty():
@@ -442,9 +375,6 @@ class BBLL:
         d1_tree = set(self.D1_bounds._inorder_traversal_values())
         d1_dict = set(self.D1.keys())
 
-        #print(self.B)
-        #print(d1_tree)
-        #print(d1_dict)
         assert self.B in d1_tree and self.B in d1_dict, "Sentinel B missing"
         assert d1_tree == d1_dict, f"D1 mismatch: tree={d1_tree}, dict={d1_dict}"
 
@@ -1,20 +1,39 @@
-from benchmark.methods.BMSSP_utils.utils.MedianFinder import MedianFinder
+import math
+from bisect import bisect_left, insort
+
+import numpy as np
 
 class BNode:
+    # slots: the BBLL preallocates one BNode per vertex, so dropping the
+    # per-instance __dict__ roughly halves node memory and keeps the hot
+    # fields in one compact object during list walks
+    __slots__ = ("key", "val", "prev", "next", "block")
+
     def __init__(self, key, val):
         self.key = key
         self.val = val
         self.prev = None
         self.next = None
+        # back-reference to the Block currently holding this node, so the
+        # BBLL can delete from the right block instead of guessing by bound
+        self.block = None
 
 
 # Circular Doubly Linked List implementation of Block
 class Block:
+    __slots__ = ("head", "size", "max_val", "min_val", "vals_sorted", "bound")
+
     def __init__(self):
         self.head = None
         self.size = 0
         self.max_val = float('-inf')
-        self.min_val = float('inf')
+        self.min_val = math.inf
+        # sorted mirror of the node values: keeps min/max/median O(1)-O(log n)
+        # instead of re-walking the whole list after deleting an extreme
+        self.vals_sorted = []
+        # the bound this block is registered under in the BBLL, stamped by
+        # the BBLL whenever the block is (re)filed in D0/D1
+        self.bound = None
 
     def insert(self, node):
         """Insert a node at the end."""
@@ -22,11 +41,11 @@ class Block:
             return
 
         # Update size and extreme vals
+        node.block = self
         self.size += 1
-        if node.val > self.max_val:
-            self.max_val = node.val
-        if node.val < self.min_val:
-            self.min_val = node.val
+        insort(self.vals_sorted, node.val)
+        self.max_val = self.vals_sorted[-1]
+        self.min_val = self.vals_sorted[0]
 
         if self.head is None:
             node.next = node.prev = node
@@ -54,7 +73,10 @@ class Block:
             self.head = None
             self.size = 0
             self.max_val = float('-inf')
-            self.min_val = float('inf')
+            self.min_val = math.inf
+            self.vals_sorted.clear()
+            node.prev = node.next = None
+            node.block = None
             return
 
         # If deleting the head
@@ -63,46 +85,13 @@ class Block:
 
         node.prev.next = node.next
         node.next.prev = node.prev
+        node.prev = node.next = None
+        node.block = None
         self.size -= 1
 
-        # Recompute extreme values only if needed
-        if node.val == self.max_val:
-            self.recompute_max()
-
-        if node.val == self.min_val:
-            self.recompute_min()
-
-    def recompute_max(self):
-        """Recompute max_val by traversing all nodes (O(n))."""
-        if self.is_empty():
-            self.max_val = float('-inf')
-            return
-
-        current = self.head
-        new_max = current.val
-        while True:
-            if current.val > new_max:
-                new_max = current.val
-            current = current.next
-            if current == self.head:
-                break
-        self.max_val = new_max
-
-    def recompute_min(self):
-        """Recompute min_val by traversing all nodes (O(n))."""
-        if self.is_empty():
-            self.min_val = float('inf')
-            return
-
-        current = self.head
-        new_min = current.val
-        while True:
-            if current.val < new_min:
-                new_min = current.val
-            current = current.next
-            if current == self.head:
-                break
-        self.min_val = new_min
+        del self.vals_sorted[bisect_left(self.vals_sorted, node.val)]
+        self.max_val = self.vals_sorted[-1]
+        self.min_val = self.vals_sorted[0]
 
     def get_max(self):
         """Return the maximum value in the block."""
@@ -116,49 +105,42 @@ class Block:
         if self.is_empty():
             return None
 
-        # Gather all values from the circular linked list
-        values = []
-        current = self.head
-        while True:
-            values.append(current.val)
-            current = current.next
-            if current == self.head:
-                break
-
-        return MedianFinder.find_median(values)
+        # The sorted mirror makes this an index lookup instead of quickselect
+        n = len(self.vals_sorted)
+        if n % 2 == 1:
+            return self.vals_sorted[n // 2]
+        return (self.vals_sorted[n // 2 - 1] + self.vals_sorted[n // 2]) / 2
     
     def find_median_index(self):
         if self.is_empty():
             return None
 
-        # Gather all values from the circular linked list
-        values = []
-        current = self.head
-        while True:
-            values.append(current.key)
-            current = current.next
-            if current == self.head:
-                break
-
-        return MedianFinder.find_median(values)
+        # np.partition is a C quickselect over the gathered keys
+        keys = np.fromiter(
+            (node.key for node in self.iterate()), dtype=np.int64, count=self.size)
+        mid = self.size // 2
+        if self.size % 2 == 1:
+            return int(np.partition(keys, mid)[mid])
+        part = np.partition(keys, [mid - 1, mid])
+        return (int(part[mid - 1]) + int(part[mid])) / 2
     
     def find_candidate_index(self):
         if self.is_empty():
             return None
-        
+
         candidate = self.get_min()
 
-        # Gather all values from the circular linked list
-        values = []
+        # single pass with a running minimum — no intermediate list
+        best = None
         current = self.head
         while True:
-            if current.val == candidate:
-                values.append(current.key)
+            if current.val == candidate and (best is None or current.key < best):
+                best = current.key
             current = current.next
             if current == self.head:
                 break
 
-        return min(values)
+        return best
     
     def iterate(self):
         """Iterate through all nodes in a circular block."""
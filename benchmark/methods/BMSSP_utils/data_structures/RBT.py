@@ -1,6 +1,16 @@
+# node colors as ints: a color test is a single integer compare instead of
+# a unicode comparison on every fix-up step
+RED = 1
+BLACK = 0
+
+
 class RBNode:
+    # fixed slots: no per-node __dict__, so attribute loads in the fix-up
+    # loops hit a compact object instead of a dict lookup
+    __slots__ = ("value", "color", "left", "right", "parent")
+
     # constructor
-    def __init__(self, value, color='red'):
+    def __init__(self, value, color=RED):
         self.value = value
         self.color = color
         self.left = None
@@ -9,13 +19,13 @@ class RBNode:
 
     # function to get the grandparent of node
     def grandparent(self):
-        if self.parent is None:
+        if self.parent is NIL:
             return None
         return self.parent.parent
 
     # function to get the sibling of node
     def sibling(self):
-        if self.parent is None:
+        if self.parent is NIL:
             return None
         if self == self.parent.left:
             return self.parent.right
@@ -23,44 +33,64 @@ class RBNode:
 
     # function to get the uncle of node
     def uncle(self):
-        if self.parent is None:
+        if self.parent is NIL:
             return None
         return self.parent.sibling()
 
 
+# Single shared sentinel for all trees: every leaf and the root's parent
+# point here, so color/child reads never need an `is None` guard first
+NIL = RBNode(None, color=BLACK)
+NIL.left = NIL
+NIL.right = NIL
+NIL.parent = NIL
+
+
 class RedBlackTree:
     # constructor to initialize the RB tree
     def __init__(self):
         # Shared sentinel NIL node (represents all leaves)
-        self.NIL = RBNode(None, color='black')
-        self.NIL.left = self.NIL
-        self.NIL.right = self.NIL
-        self.NIL.parent = None
+        self.NIL = NIL
 
         # When empty, root == self.NIL (not None)
         self.root = self.NIL
         self._size = 0
 
+        # cached minimum node: the BMSSP workload asks for the smallest
+        # bound far more often than it restructures the tree
+        self._min = None
+
+        # free-list of detached nodes: steady-state insert/delete cycles
+        # recycle RBNode objects instead of allocating fresh ones
+        self._free = []
+
     # function to search a value in RB Tree
     def search(self, value):
+        # NIL hoisted to a local and identity compares: the loop body is
+        # down to one value load and one child load per level
+        NIL = self.NIL
         curr_node = self.root
-        while curr_node != self.NIL:
-            if value == curr_node.value:
+        while curr_node is not NIL:
+            cv = curr_node.value
+            if value == cv:
                 return curr_node
-            elif value < curr_node.value:
-                curr_node = curr_node.left
-            else:
-                curr_node = curr_node.right
+            curr_node = curr_node.left if value < cv else curr_node.right
         return None
-    
+
     # function to search a node which has a value just above the value of interest
     def search_bound(self, value):
+        # everything stored is above `value`: the cached minimum is the answer
+        if self._min is not None and value < self._min.value:
+            return self._min.value
+
+        NIL = self.NIL
         curr = self.root
         candidate = None
 
-        while curr != self.NIL:
-            if curr.value > value:
-                candidate = curr.value
+        while curr is not NIL:
+            cv = curr.value
+            if cv > value:
+                candidate = cv
                 curr = curr.left
             else:
                 curr = curr.right
@@ -69,13 +99,17 @@ class RedBlackTree:
 
     # function to insert a node in RB Tree, similar to BST insertion
     def insert(self, value):
-        new_node = RBNode(value)
-        new_node.color = 'red'
+        if self._free:
+            new_node = self._free.pop()
+            new_node.value = value
+        else:
+            new_node = RBNode(value)
+        new_node.color = RED
         new_node.left = self.NIL
         new_node.right = self.NIL
-        new_node.parent = None
+        new_node.parent = NIL
 
-        parent = None
+        parent = NIL
         curr_node = self.root
 
         # Standard BST insert
@@ -87,7 +121,7 @@ class RedBlackTree:
                 curr_node = curr_node.right
 
         new_node.parent = parent
-        if parent is None:
+        if parent is NIL:
             # Tree was empty
             self.root = new_node
         elif value < parent.value:
@@ -96,48 +130,100 @@ class RedBlackTree:
             parent.right = new_node
 
         self._size += 1
+        if self._min is None or value < self._min.value:
+            self._min = new_node
         self.insert_fix(new_node)
 
     # Function to fix RB tree properties after insertion
     def insert_fix(self, z):
-        # CLRS-style insert fix-up
-        while z.parent is not None and z.parent.color == 'red':
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right  # uncle
-                if y.color == 'red':
+        # CLRS-style insert fix-up; the sentinel parent is black, so no
+        # `is None` guard is needed. Parent and grandparent are hoisted
+        # into locals once per iteration instead of re-walking z.parent
+        # chains at every use.
+        p = z.parent
+        while p.color == RED:
+            g = p.parent
+            if p is g.left:
+                y = g.right  # uncle
+                if y.color == RED:
                     # Case 1
-                    z.parent.color = 'black'
-                    y.color = 'black'
-                    z.parent.parent.color = 'red'
-                    z = z.parent.parent
+                    p.color = BLACK
+                    y.color = BLACK
+                    g.color = RED
+                    z = g
                 else:
-                    if z == z.parent.right:
-                        # Case 2
-                        z = z.parent
+                    if z is p.right:
+                        # Case 2; the rotation keeps g as grandparent
+                        z = p
                         self.rotate_left(z)
+                        p = z.parent
                     # Case 3
-                    z.parent.color = 'black'
-                    z.parent.parent.color = 'red'
-                    self.rotate_right(z.parent.parent)
+                    p.color = BLACK
+                    g.color = RED
+                    self.rotate_right(g)
             else:
-                y = z.parent.parent.left  # uncle (mirror)
-                if y.color == 'red':
+                y = g.left  # uncle (mirror)
+                if y.color == RED:
                     # Mirror Case 1
-                    z.parent.color = 'black'
-                    y.color = 'black'
-                    z.parent.parent.color = 'red'
-                    z = z.parent.parent
+                    p.color = BLACK
+                    y.color = BLACK
+                    g.color = RED
+                    z = g
                 else:
-                    if z == z.parent.left:
+                    if z is p.left:
                         # Mirror Case 2
-                        z = z.parent
+                        z = p
                         self.rotate_right(z)
+                        p = z.parent
                     # Mirror Case 3
-                    z.parent.color = 'black'
-                    z.parent.parent.color = 'red'
-                    self.rotate_left(z.parent.parent)
+                    p.color = BLACK
+                    g.color = RED
+                    self.rotate_left(g)
+            p = z.parent
+
+        self.root.color = BLACK
+
+    # function to rebuild the whole tree from an iterable of values in O(n)
+    def bulk_load(self, values):
+        """Replace the tree contents with `values`, built bottom-up.
+
+        Sorting plus a midpoint-split build is O(n) after the sort and
+        performs no rotations, versus O(n log n) fix-up work for n repeated
+        inserts. Nodes on the deepest level are colored red, everything
+        above black, which satisfies the red-black invariants for a
+        midpoint-balanced tree.
+        """
+        values = sorted(values)
+        n = len(values)
+        if n == 0:
+            self.root = NIL
+            self._size = 0
+            self._min = None
+            return
 
-        self.root.color = 'black'
+        max_depth = n.bit_length() - 1
+
+        def build(lo, hi, depth):
+            if lo >= hi:
+                return NIL
+            mid = (lo + hi) // 2
+            node = RBNode(values[mid],
+                          color=RED if depth == max_depth else BLACK)
+            node.parent = NIL
+            left = build(lo, mid, depth + 1)
+            right = build(mid + 1, hi, depth + 1)
+            node.left = left
+            node.right = right
+            if left is not NIL:
+                left.parent = node
+            if right is not NIL:
+                right.parent = node
+            return node
+
+        self.root = build(0, n, 0)
+        self.root.color = BLACK
+        self._size = n
+        self._min = self._find_min(self.root)
 
     def delete(self, value):
         z = self.search(value)
@@ -175,75 +261,87 @@ class RedBlackTree:
             y.color = z.color
 
         # If we removed a black node, fix double-black
-        if y_original_color == "black":
+        if y_original_color == BLACK:
             # parent argument is kept for signature compatibility, but not used.
             self.delete_fix(x, parent=None)
 
+        # z is detached now; clear its links and recycle it
+        z.left = z.right = z.parent = NIL
+        z.value = None
+        self._free.append(z)
+
+        if z is self._min:
+            self._min = self._find_min(self.root)
+
     def delete_fix(self, x, parent=None):
         """
         Fix double-black violations after deletion.
         The 'parent' parameter is kept only to preserve the original method signature.
         All logic uses x.parent, as in standard CLRS fix-up.
         """
-        while x != self.root and x.color == "black":
-            if x == x.parent.left:
-                sibling = x.parent.right
-
-                if sibling.color == "red":
+        # x's parent is hoisted into a local per iteration; the rotations
+        # in Cases 1 and 3 never change x's parent, so `p` stays valid
+        # across them
+        while x != self.root and x.color == BLACK:
+            p = x.parent
+            if x is p.left:
+                sibling = p.right
+
+                if sibling.color == RED:
                     # Case 1
-                    sibling.color = "black"
-                    x.parent.color = "red"
-                    self.rotate_left(x.parent)
-                    sibling = x.parent.right
+                    sibling.color = BLACK
+                    p.color = RED
+                    self.rotate_left(p)
+                    sibling = p.right
 
-                if sibling.left.color == "black" and sibling.right.color == "black":
+                if sibling.left.color == BLACK and sibling.right.color == BLACK:
                     # Case 2
-                    sibling.color = "red"
-                    x = x.parent
+                    sibling.color = RED
+                    x = p
                 else:
-                    if sibling.right.color == "black":
+                    if sibling.right.color == BLACK:
                         # Case 3
-                        sibling.left.color = "black"
-                        sibling.color = "red"
+                        sibling.left.color = BLACK
+                        sibling.color = RED
                         self.rotate_right(sibling)
-                        sibling = x.parent.right
+                        sibling = p.right
 
                     # Case 4
-                    sibling.color = x.parent.color
-                    x.parent.color = "black"
-                    sibling.right.color = "black"
-                    self.rotate_left(x.parent)
+                    sibling.color = p.color
+                    p.color = BLACK
+                    sibling.right.color = BLACK
+                    self.rotate_left(p)
                     x = self.root
             else:
-                sibling = x.parent.left
+                sibling = p.left
 
-                if sibling.color == "red":
+                if sibling.color == RED:
                     # Mirror Case 1
-                    sibling.color = "black"
-                    x.parent.color = "red"
-                    self.rotate_right(x.parent)
-                    sibling = x.parent.left
+                    sibling.color = BLACK
+                    p.color = RED
+                    self.rotate_right(p)
+                    sibling = p.left
 
-                if sibling.right.color == "black" and sibling.left.color == "black":
+                if sibling.right.color == BLACK and sibling.left.color == BLACK:
                     # Mirror Case 2
-                    sibling.color = "red"
-                    x = x.parent
+                    sibling.color = RED
+                    x = p
                 else:
-                    if sibling.left.color == "black":
+                    if sibling.left.color == BLACK:
                         # Mirror Case 3
-                        sibling.right.color = "black"
-                        sibling.color = "red"
+                        sibling.right.color = BLACK
+                        sibling.color = RED
                         self.rotate_left(sibling)
-                        sibling = x.parent.left
+                        sibling = p.left
 
                     # Mirror Case 4
-                    sibling.color = x.parent.color
-                    x.parent.color = "black"
-                    sibling.left.color = "black"
-                    self.rotate_right(x.parent)
+                    sibling.color = p.color
+                    p.color = BLACK
+                    sibling.left.color = BLACK
+                    self.rotate_right(p)
                     x = self.root
 
-        x.color = "black"
+        x.color = BLACK
 
     # Function for left rotation of RB Tree
     def rotate_left(self, node):
@@ -257,7 +355,7 @@ class RedBlackTree:
 
         right_child.parent = node.parent
 
-        if node.parent is None:
+        if node.parent is NIL:
             self.root = right_child
         elif node == node.parent.left:
             node.parent.left = right_child
@@ -279,7 +377,7 @@ class RedBlackTree:
 
         left_child.parent = node.parent
 
-        if node.parent is None:
+        if node.parent is NIL:
             self.root = left_child
         elif node == node.parent.right:
             node.parent.right = left_child
@@ -298,7 +396,7 @@ class RedBlackTree:
         if new_node is None:
             new_node = self.NIL
 
-        if old_node.parent is None:
+        if old_node.parent is NIL:
             self.root = new_node
         elif old_node == old_node.parent.left:
             old_node.parent.left = new_node
@@ -309,17 +407,19 @@ class RedBlackTree:
 
     # function to find node with minimum value in a subtree
     def _find_min(self, node):
-        if node is None or node == self.NIL:
+        NIL = self.NIL
+        if node is None or node is NIL:
             return None
-        while node.left != self.NIL:
+        while node.left is not NIL:
             node = node.left
         return node
-    
+
     # function to find node with maximum value in a subtree
     def _find_max(self, node):
-        if node is None or node == self.NIL:
+        NIL = self.NIL
+        if node is None or node is NIL:
             return None
-        while node.right != self.NIL:
+        while node.right is not NIL:
             node = node.right
         return node
 
@@ -333,16 +433,39 @@ class RedBlackTree:
 
     # function to return values in inorder traversal
     def _inorder_traversal_values(self):
+        # iterative with an explicit stack: no Python call frame per node
         result = []
-        def _walk(node):
-            if node == self.NIL:
-                return
-            _walk(node.left)
-            result.append(node.value)
-            _walk(node.right)
-        _walk(self.root)
+        append = result.append
+        NIL = self.NIL
+        stack = []
+        cur = self.root
+        while cur is not NIL or stack:
+            while cur is not NIL:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            append(cur.value)
+            cur = cur.right
         return result
     
+    # lazy inorder traversal: yields values one at a time, so callers that
+    # only scan a prefix (or just iterate) never pay for the full list
+    def iter_inorder(self):
+        NIL = self.NIL
+        stack = []
+        cur = self.root
+        while cur is not NIL or stack:
+            while cur is not NIL:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            yield cur.value
+            cur = cur.right
+
+    # O(1) smallest stored value (None when empty)
+    def get_min(self):
+        return self._min.value if self._min is not None else None
+
     def get_size(self):
         return self._size
 
@@ -0,0 +1,63 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class _Bound:
+    # minimal node-like wrapper so _find_min/_find_max callers keep
+    # reading .value as they did with tree nodes
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+# Flat sorted-list replacement for the red-black bound trees
+class SortedBoundSet:
+    """Ordered multiset of block bounds, stored as one sorted Python list.
+
+    The BBLL only needs insert, delete and bounded-successor queries over a
+    handful of bounds, so a contiguous list with C-coded bisect beats a
+    pointer-chasing tree: insert is a binary search plus memmove, successor
+    is a single bisect_right, min/max are index reads. Bounds are kept as
+    the original objects (int64 keys stay exact) rather than coerced to
+    floats. Exposes the slice of the RedBlackTree API the BBLL uses.
+    """
+    __slots__ = ("_a",)
+
+    def __init__(self):
+        self._a = []
+
+    @property
+    def root(self):
+        # tree-API parity: truthy handle when non-empty, else None
+        return self if self._a else None
+
+    def insert(self, value):
+        insort(self._a, value)
+
+    def delete(self, value):
+        i = bisect_left(self._a, value)
+        if i < len(self._a) and self._a[i] == value:
+            del self._a[i]
+
+    # smallest stored bound strictly greater than value, or None
+    def search_bound(self, value):
+        i = bisect_right(self._a, value)
+        return self._a[i] if i < len(self._a) else None
+
+    def _find_min(self, node=None):
+        return _Bound(self._a[0]) if self._a else None
+
+    def _find_max(self, node=None):
+        return _Bound(self._a[-1]) if self._a else None
+
+    def _inorder_traversal_values(self):
+        return list(self._a)
+
+    def iter_inorder(self):
+        return iter(self._a)
+
+    def get_size(self):
+        return len(self._a)
+
+    def is_empty(self):
+        return not self._a
@@ -1,29 +1,18 @@
-import random
+import numpy as np
 
 class MedianFinder():
     def find_median(values):
-        """Find the median of node values in O(n) expected time using Quickselect."""
-        # Quickselect helper
-        def quickselect(arr, k):
-            if len(arr) == 1:
-                return arr[0]
-            pivot = random.choice(arr)
-            lows = [x for x in arr if x < pivot]
-            highs = [x for x in arr if x > pivot]
-            pivots = [x for x in arr if x == pivot]
+        """Find the median of node values in O(n) using numpy's introselect.
 
-            if k < len(lows):
-                return quickselect(lows, k)
-            elif k < len(lows) + len(pivots):
-                return pivot
-            else:
-                return quickselect(highs, k - len(lows) - len(pivots))
-
-        # Get median position(s)
-        n = len(values)
+        np.partition does the selection in C (SIMD-friendly compares, no
+        boxed comparisons), replacing the recursive pure-Python quickselect
+        that rebuilt three lists per pivot round. The even case partitions
+        both middle order statistics in a single call.
+        """
+        a = np.asarray(values)
+        n = a.size
+        mid = n // 2
         if n % 2 == 1:
-            return quickselect(values, n // 2)
-        else:
-            left = quickselect(values, n // 2 - 1)
-            right = quickselect(values, n // 2)
-            return (left + right) / 2
\ No newline at end of file
+            return np.partition(a, mid)[mid].item()
+        part = np.partition(a, (mid - 1, mid))
+        return (part[mid - 1] + part[mid]).item() / 2
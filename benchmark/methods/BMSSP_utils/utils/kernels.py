@@ -0,0 +1,189 @@
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba installed
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels stay importable without numba."""
+        def decorator(func):
+            return func
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit(cache=True, boundscheck=False)
+def relax_frontier(indptr, indices, weights, dist, pred, key, frontier, B, scale, c1, c2, out, seen):
+    """Relax every outgoing edge of `frontier` once (one k-relaxation round).
+
+    dist/pred/key are updated in place; `key` caches the integer tie-break
+    key round(dist * scale) * c1 + (pred + 1) * c2 + v so the comparison is a
+    single int64 load instead of recomputing it per edge. Newly improved
+    vertices with key < B are written into `out` (deduplicated via the `seen`
+    scratch bitmap, which is cleared again before returning). Returns the
+    number of vertices written to `out`.
+    """
+    n_out = 0
+    for i in range(frontier.shape[0]):
+        u = frontier[i]
+        d_u = dist[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            alt = d_u + weights[e]
+            alt_mult = np.int64(alt * scale + 0.5) * c1 + (u + 1) * c2 + v
+
+            if alt_mult <= key[v]:
+                dist[v] = alt
+                pred[v] = u
+                key[v] = alt_mult
+
+                if alt_mult < B and seen[v] == 0:
+                    seen[v] = 1
+                    out[n_out] = v
+                    n_out += 1
+
+    for j in range(n_out):
+        seen[out[j]] = 0
+
+    return n_out
+
+
+@njit(cache=True, boundscheck=False)
+def spfa(indptr, indices, weights, dist, pred, source, counters):
+    """Queue-based Bellman-Ford (SPFA) over the CSR arrays.
+
+    Only vertices whose distance improved are scanned again, using a FIFO
+    ring buffer with an in-queue bitmap; the ring never overflows because
+    a vertex is enqueued only while absent from it. dist/pred are updated
+    in place. A vertex enqueued more than n times lies on a reachable
+    negative cycle, in which case 0 is returned (1 otherwise). counters
+    receives [vertices dequeued, edges scanned, successful relaxations].
+    """
+    n = indptr.shape[0] - 1
+    cap = n + 1
+    q = np.empty(cap, dtype=np.int64)
+    in_q = np.zeros(n, dtype=np.uint8)
+    enq_count = np.zeros(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    q[tail] = source
+    tail = (tail + 1) % cap
+    in_q[source] = 1
+    enq_count[source] = 1
+    iterations = 0
+    scanned = 0
+    improved = 0
+
+    while head != tail:
+        u = q[head]
+        head = (head + 1) % cap
+        in_q[u] = 0
+        iterations += 1
+        d_u = dist[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            scanned += 1
+            alt = d_u + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                pred[v] = u
+                improved += 1
+                if in_q[v] == 0:
+                    in_q[v] = 1
+                    q[tail] = v
+                    tail = (tail + 1) % cap
+                    enq_count[v] += 1
+                    if enq_count[v] > n:
+                        counters[0] = iterations
+                        counters[1] = scanned
+                        counters[2] = improved
+                        return 0
+
+    counters[0] = iterations
+    counters[1] = scanned
+    counters[2] = improved
+    return 1
+
+
+@njit(cache=True, boundscheck=False)
+def base_case_expand(indptr, indices, weights, dist, pred, key, x, B, k,
+                     scale, c1, c2, heap_d, heap_u, out, visited):
+    """Bounded Dijkstra expansion from `x`, settling at most k + 1 vertices.
+
+    The whole pop/relax loop runs in compiled code over the CSR arrays, with
+    a manual binary heap in the (heap_d, heap_u) scratch arrays ordered by
+    (dist, vertex) — the same order heapq gives (d, u) tuples, so results
+    are bit-identical to the interpreted path. dist/pred/key are updated in
+    place under the `key < B` bound; settled vertices are written to `out`
+    (the `visited` scratch bitmap is cleared again before returning).
+    Returns the number of vertices settled.
+    """
+    heap_d[0] = dist[x]
+    heap_u[0] = x
+    hs = 1
+    n_set = 0
+
+    while hs > 0 and n_set < k + 1:
+        # pop the (d, u) minimum, then sift the displaced tail entry down
+        d_u = heap_d[0]
+        u = heap_u[0]
+        hs -= 1
+        if hs > 0:
+            dl = heap_d[hs]
+            ul = heap_u[hs]
+            i = 0
+            while True:
+                c = 2 * i + 1
+                if c >= hs:
+                    break
+                r = c + 1
+                if r < hs and (heap_d[r] < heap_d[c]
+                               or (heap_d[r] == heap_d[c] and heap_u[r] < heap_u[c])):
+                    c = r
+                if heap_d[c] < dl or (heap_d[c] == dl and heap_u[c] < ul):
+                    heap_d[i] = heap_d[c]
+                    heap_u[i] = heap_u[c]
+                    i = c
+                else:
+                    break
+            heap_d[i] = dl
+            heap_u[i] = ul
+
+        if d_u > dist[u] or visited[u] == 1:
+            continue
+
+        visited[u] = 1
+        out[n_set] = u
+        n_set += 1
+
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            alt = d_u + weights[e]
+            alt_mult = np.int64(alt * scale + 0.5) * c1 + (u + 1) * c2 + v
+
+            if alt_mult <= key[v] and alt_mult < B:
+                dist[v] = alt
+                pred[v] = u
+                key[v] = alt_mult
+
+                # sift (alt, v) up from the new tail slot
+                j = hs
+                hs += 1
+                while j > 0:
+                    p = (j - 1) // 2
+                    if alt < heap_d[p] or (alt == heap_d[p] and v < heap_u[p]):
+                        heap_d[j] = heap_d[p]
+                        heap_u[j] = heap_u[p]
+                        j = p
+                    else:
+                        break
+                heap_d[j] = alt
+                heap_u[j] = v
+
+    for i in range(n_set):
+        visited[out[i]] = 0
+
+    return n_set
@@ -1,12 +1,16 @@
 import math
+
+import numpy as np
+
 from benchmark.methods.base import BaseShortestPath
+from benchmark.methods.BMSSP_utils.utils.kernels import spfa
 
 
 class BellmanFord(BaseShortestPath):
     def validate(self) -> bool:
         # Bellman-Ford accepts negative weights; always valid
         return True
-    
+
     def setup(self):
         self.reset_state()
 
@@ -21,37 +25,46 @@ class BellmanFord(BaseShortestPath):
         else:
             self.dist[self.source] = 0.0
 
+    def _get_csr(self, n: int):
+        """CSR arrays for the graph: shared from Graph.finalize() when
+        available, otherwise built once from the edge list (test mocks)."""
+        if hasattr(self.graph, "finalize"):
+            self.graph.finalize()
+            return self.graph.indptr, self.graph.indices, self.graph.weights
 
-    def run(self) -> bool:
         edges = self.graph.get_all_edges()
-        n = self.graph.node_count
-
-        # Relax edges up to n-1 times
-        for _ in range(max(0, n - 1)):
-            self.iterations += 1
-            any_relaxed = False
-            for u, v, w in edges:
-                self.edge_relaxations += 1
-                du = self.dist.get(u, math.inf)
-                if math.isinf(du):
-                    continue
-                if du + w < self.dist.get(v, math.inf):
-                    self.dist[v] = du + w
-                    self.pred[v] = u
-                    self.successful_relaxations += 1
-                    any_relaxed = True
-            # if not any_relaxed:
-            #     break
-
-        # final pass to detect negative cycles reachable from source
-        self.iterations += 1
-        for u, v, w in edges:
-            self.edge_relaxations += 1
-            du = self.dist.get(u, math.inf)
-            if math.isinf(du):
-                continue
-            if du + w < self.dist.get(v, math.inf):
-                # negative cycle detected
-                return False
+        m = len(edges)
+        eu = np.fromiter((e[0] for e in edges), dtype=np.int64, count=m)
+        ev = np.fromiter((e[1] for e in edges), dtype=np.int64, count=m)
+        ew = np.fromiter((e[2] for e in edges), dtype=np.float64, count=m)
 
-        return True
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(eu, minlength=n), out=indptr[1:])
+        order = np.argsort(eu, kind="stable")
+        return indptr, ev[order], ew[order]
+
+    def run(self) -> bool:
+        n = max(self.graph.node_count, self.source + 1)
+        indptr, indices, weights = self._get_csr(n)
+
+        dist = np.full(n, np.inf, dtype=np.float64)
+        pred = np.full(n, -1, dtype=np.int64)
+        dist[self.source] = 0.0
+
+        # SPFA: queue-based Bellman-Ford. Instead of n-1 sweeps over every
+        # edge, only vertices whose distance improved are rescanned, so the
+        # counters reflect the work actually done. Negative cycles are
+        # detected inside the kernel via per-vertex enqueue counts.
+        counters = np.zeros(3, dtype=np.int64)
+        settled = spfa(indptr, indices, weights, dist, pred,
+                       self.source, counters)
+
+        self.iterations += int(counters[0])
+        self.edge_relaxations += int(counters[1])
+        self.successful_relaxations += int(counters[2])
+
+        for i in range(n):
+            self.dist[i] = float(dist[i])
+            self.pred[i] = int(pred[i]) if pred[i] >= 0 else None
+
+        return bool(settled)
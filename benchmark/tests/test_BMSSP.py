@@ -0,0 +1,114 @@
+import math
+import random
+import unittest
+from benchmark.datastructures.graph import Graph
+from benchmark.methods.BMSSP import BMSSP
+from benchmark.methods.dijkstra import Dijkstra
+
+
+class TestBMSSPRun(unittest.TestCase):
+    """Randomized equivalence of the full solver against Dijkstra"""
+
+    def _check_random_graphs(self, weight):
+        for seed, n in ((11, 60), (23, 90), (37, 120)):
+            random.seed(seed)
+            m = n * 4
+            graph = Graph(directed=True)
+            for _ in range(m):
+                graph.add_edge(random.randrange(n), random.randrange(n),
+                               weight(random))
+            graph.node_count = max(graph.node_count, n)
+
+            dijkstra = Dijkstra(graph, 0)
+            dijkstra.setup()
+            dijkstra.run()
+
+            solver = BMSSP(graph, 0)
+            solver.setup()
+            solver.run()
+
+            for node in range(n):
+                expected = dijkstra.dist[node]
+                got = solver.distance(node)
+                if math.isinf(expected):
+                    self.assertEqual(got, math.inf, (seed, node))
+                else:
+                    self.assertAlmostEqual(got, expected, places=6,
+                                           msg=(seed, node))
+
+    def test_matches_dijkstra_integer_weights(self):
+        """run() must agree with Dijkstra on random integer-weight graphs"""
+        self._check_random_graphs(lambda rng: rng.randint(1, 10))
+
+    def test_matches_dijkstra_float_weights(self):
+        """run() must agree with Dijkstra on random float-weight graphs"""
+        self._check_random_graphs(
+            lambda rng: round(rng.uniform(0.1, 10.0), 3))
+
+
+class TestBMSSPBidirectional(unittest.TestCase):
+    """Test suite for the point-to-point bidirectional query"""
+
+    def test_matches_dijkstra_on_random_graphs(self):
+        """run_bidirectional should agree with Dijkstra on every target"""
+        for seed in (7, 42):
+            random.seed(seed)
+            n, m = 60, 240
+            graph = Graph(directed=True)
+            for _ in range(m):
+                graph.add_edge(random.randrange(n), random.randrange(n),
+                               round(random.uniform(0.1, 10.0), 3))
+            graph.node_count = max(graph.node_count, n)
+
+            dijkstra = Dijkstra(graph, 0)
+            dijkstra.setup()
+            dijkstra.run()
+
+            solver = BMSSP(graph, 0)
+            for target in range(n):
+                expected = dijkstra.dist[target]
+                got = solver.run_bidirectional(target)
+                if math.isinf(expected):
+                    self.assertEqual(got, math.inf, (seed, target))
+                else:
+                    self.assertAlmostEqual(got, expected, places=6,
+                                           msg=(seed, target))
+
+    def test_unreachable_target(self):
+        """No path to the target should give infinity"""
+        graph = Graph(directed=True)
+        graph.add_edge(0, 1, 1.0)
+        graph.node_count = 3
+        solver = BMSSP(graph, 0)
+        self.assertEqual(solver.run_bidirectional(2), math.inf)
+
+    def test_target_equals_source(self):
+        """Distance from the source to itself is zero"""
+        graph = Graph(directed=True)
+        graph.add_edge(0, 1, 1.0)
+        solver = BMSSP(graph, 0)
+        self.assertEqual(solver.run_bidirectional(0), 0.0)
+
+    def test_target_out_of_range(self):
+        """Targets outside the vertex range should give infinity"""
+        graph = Graph(directed=True)
+        graph.add_edge(0, 1, 1.0)
+        solver = BMSSP(graph, 0)
+        self.assertEqual(solver.run_bidirectional(5), math.inf)
+        self.assertEqual(solver.run_bidirectional(-1), math.inf)
+
+    def test_does_not_disturb_run_state(self):
+        """A point-to-point query must not change dist/pred from run()"""
+        graph = Graph(directed=True)
+        graph.add_edge(0, 1, 2.0)
+        graph.add_edge(1, 2, 3.0)
+        solver = BMSSP(graph, 0)
+        solver.setup()
+        solver.run()
+        before = [solver.distance(i) for i in range(3)]
+        solver.run_bidirectional(2)
+        self.assertEqual([solver.distance(i) for i in range(3)], before)
+
+
+if __name__ == '__main__':
+    unittest.main()
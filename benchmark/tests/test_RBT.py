@@ -1,5 +1,9 @@
 import unittest
-from benchmark.methods.BMSSP_utils.data_structures.RBT import RedBlackTree, RBNode
+from collections import Counter
+
+import numpy as np
+
+from benchmark.methods.BMSSP_utils.data_structures.RBT import BLACK, RED, RBNode, RedBlackTree
 
 
 # ---------------------------
@@ -7,9 +11,11 @@ from benchmark.methods.BMSSP_utils.data_structures.RBT import RedBlackTree, RBNo
 # ---------------------------
 
 def assert_inorder_sorted(tree):
-    """Ensure in-order traversal returns a sorted list."""
-    values = tree._inorder_traversal_values()
-    assert values == sorted(values)
+    """Ensure in-order traversal yields values in sorted order."""
+    # O(n) vectorized monotonicity check instead of sorting a second copy
+    values = np.fromiter(tree.iter_inorder(), dtype=np.int64,
+                         count=tree.get_size())
+    assert bool(np.all(values[:-1] <= values[1:]))
 
 
 def assert_red_black_properties(tree):
@@ -26,34 +32,42 @@ def assert_red_black_properties(tree):
         return
 
     # Root must be black
-    assert tree.root.color == "black"
+    assert tree.root.color == BLACK
 
     NIL = tree.NIL
 
     # Property 2: No red node has red children
-    def check_no_red_red(node):
+    # (explicit-stack walk: no Python call frame per node)
+    stack = [tree.root]
+    while stack:
+        node = stack.pop()
         if node is NIL:
-            return
-        if node.color == "red":
+            continue
+        if node.color == RED:
             if node.left is not NIL:
-                assert node.left.color == "black"
+                assert node.left.color == BLACK
             if node.right is not NIL:
-                assert node.right.color == "black"
-        check_no_red_red(node.left)
-        check_no_red_red(node.right)
-
-    check_no_red_red(tree.root)
+                assert node.right.color == BLACK
+        stack.append(node.left)
+        stack.append(node.right)
 
     # Property 3: all paths from node to NIL have same black height
-    def black_height(node):
-        if node is NIL:
-            return 1
-        lh = black_height(node.left)
-        rh = black_height(node.right)
+    # (iterative post-order: a node is popped once both child heights exist)
+    height = {id(NIL): 1}
+    stack = [tree.root]
+    while stack:
+        node = stack[-1]
+        lh = height.get(id(node.left))
+        rh = height.get(id(node.right))
+        if lh is None or rh is None:
+            if lh is None:
+                stack.append(node.left)
+            if rh is None:
+                stack.append(node.right)
+            continue
+        stack.pop()
         assert lh == rh
-        return lh + (1 if node.color == "black" else 0)
-
-    black_height(tree.root)
+        height[id(node)] = lh + (1 if node.color == BLACK else 0)
 
 
 # ---------------------------
@@ -109,6 +123,25 @@ class TestRedBlackTree(unittest.TestCase):
         assert_inorder_sorted(t)
         assert_red_black_properties(t)
 
+    def test_bulk_load_matches_incremental_insert(self):
+        import random
+        data = random.sample(range(1000), 200)
+
+        t = RedBlackTree()
+        t.bulk_load(data)
+
+        self.assertEqual(t.get_size(), len(data))
+        self.assertEqual(t.get_min(), min(data))
+        self.assertEqual(t._inorder_traversal_values(), sorted(data))
+        assert_red_black_properties(t)
+
+        # the loaded tree stays a normal mutable tree
+        victim = data[0]
+        t.delete(victim)
+        t.insert(victim)
+        assert_inorder_sorted(t)
+        assert_red_black_properties(t)
+
     # ---------------------------
     # Deletion tests
     # ---------------------------
@@ -255,24 +288,32 @@ class TestRedBlackTree(unittest.TestCase):
         self.assertEqual(t.get_size(), 1)
 
     def test_size_with_random_operations(self):
-        import random
         t = RedBlackTree()
-        inserted = []
 
-        for _ in range(100):
-            op = random.choice(["insert", "delete"])
-            x = random.randint(0, 50)
+        # shadow multiset as a Counter plus a running total: O(1) membership
+        # and removal instead of the O(n) list scan per delete
+        inserted = Counter()
+        live = 0
+
+        # precompute the op/value streams in two vectorized draws instead of
+        # one random.choice on a string list plus one randint per iteration
+        rng = np.random.default_rng(0)
+        ops = rng.integers(0, 2, 100).tolist()
+        vals = rng.integers(0, 51, 100).tolist()
 
-            if op == "insert":
+        for op, x in zip(ops, vals):
+            if op:
                 t.insert(x)
-                inserted.append(x)
+                inserted[x] += 1
+                live += 1
             else:
                 t.delete(x)
-                if x in inserted:
-                    inserted.remove(x)
+                if inserted[x]:
+                    inserted[x] -= 1
+                    live -= 1
 
-            self.assertEqual(t.get_size(), len(inserted))
-            self.assertEqual(t.is_empty(), len(inserted) == 0)
+            self.assertEqual(t.get_size(), live)
+            self.assertEqual(t.is_empty(), live == 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import unittest
+from benchmark.methods.BMSSP_utils.data_structures.SortedBoundSet import SortedBoundSet
+
+
+class TestSortedBoundSet(unittest.TestCase):
+    """Test suite for the flat sorted-list bound set"""
+
+    # --------------------------------------------------------------
+    # Empty-state shims (tree-API parity)
+    # --------------------------------------------------------------
+
+    def test_empty_state(self):
+        """Fresh set is empty with None root and min/max"""
+        s = SortedBoundSet()
+        self.assertTrue(s.is_empty())
+        self.assertEqual(s.get_size(), 0)
+        self.assertIsNone(s.root)
+        self.assertIsNone(s._find_min(s.root))
+        self.assertIsNone(s._find_max(s.root))
+        self.assertEqual(s._inorder_traversal_values(), [])
+
+    def test_root_truthy_when_non_empty(self):
+        """root is a truthy handle once a value is stored"""
+        s = SortedBoundSet()
+        s.insert(5)
+        self.assertIsNotNone(s.root)
+        self.assertFalse(s.is_empty())
+
+    # --------------------------------------------------------------
+    # Insert / delete
+    # --------------------------------------------------------------
+
+    def test_insert_keeps_sorted_order(self):
+        """Values come back sorted regardless of insertion order"""
+        s = SortedBoundSet()
+        for v in [30, 10, 20, 40]:
+            s.insert(v)
+        self.assertEqual(s._inorder_traversal_values(), [10, 20, 30, 40])
+        self.assertEqual(list(s.iter_inorder()), [10, 20, 30, 40])
+        self.assertEqual(s.get_size(), 4)
+
+    def test_min_max_wrappers(self):
+        """_find_min/_find_max expose .value like tree nodes"""
+        s = SortedBoundSet()
+        for v in [7, 3, 9]:
+            s.insert(v)
+        self.assertEqual(s._find_min(s.root).value, 3)
+        self.assertEqual(s._find_max(s.root).value, 9)
+
+    def test_delete_existing_value(self):
+        """Delete removes exactly one stored value"""
+        s = SortedBoundSet()
+        for v in [1, 2, 3]:
+            s.insert(v)
+        s.delete(2)
+        self.assertEqual(s._inorder_traversal_values(), [1, 3])
+
+    def test_delete_missing_value_is_noop(self):
+        """Deleting a value not present leaves the set unchanged"""
+        s = SortedBoundSet()
+        for v in [1, 3]:
+            s.insert(v)
+        s.delete(2)
+        s.delete(99)
+        self.assertEqual(s._inorder_traversal_values(), [1, 3])
+
+    def test_duplicates(self):
+        """Duplicates are kept as a multiset; delete drops one copy"""
+        s = SortedBoundSet()
+        for v in [5, 5, 5, 1]:
+            s.insert(v)
+        self.assertEqual(s._inorder_traversal_values(), [1, 5, 5, 5])
+        s.delete(5)
+        self.assertEqual(s._inorder_traversal_values(), [1, 5, 5])
+
+    # --------------------------------------------------------------
+    # search_bound (strict successor)
+    # --------------------------------------------------------------
+
+    def test_search_bound_strict_successor(self):
+        """search_bound returns the smallest bound strictly greater"""
+        s = SortedBoundSet()
+        for v in [10, 20, 30]:
+            s.insert(v)
+        self.assertEqual(s.search_bound(5), 10)
+        self.assertEqual(s.search_bound(10), 20)
+        self.assertEqual(s.search_bound(25), 30)
+
+    def test_search_bound_no_successor(self):
+        """No bound above the query gives None"""
+        s = SortedBoundSet()
+        s.insert(10)
+        self.assertIsNone(s.search_bound(10))
+        self.assertIsNone(s.search_bound(99))
+        self.assertIsNone(SortedBoundSet().search_bound(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
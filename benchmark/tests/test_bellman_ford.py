@@ -297,15 +297,15 @@ class TestBellmanFord(unittest.TestCase):
     
     # Metrics Tests
     def test_iterations_count(self):
-        """Run should correctly count iterations"""
+        """Run should count dequeued vertices as iterations"""
         edges = [(0, 1, 1.0), (1, 2, 1.0)]
         graph = MockGraph(edges, 3)
         bf = BellmanFord(graph, 0)
         bf.setup()
         bf.run()
-        expected_iterations = graph.node_count
-        self.assertEqual(bf.iterations, expected_iterations)
-    
+        # on this chain each vertex is dequeued exactly once
+        self.assertEqual(bf.iterations, graph.node_count)
+
     def test_edge_relaxations_count(self):
         """Run should count all edge relaxation attempts"""
         edges = [(0, 1, 1.0), (1, 2, 1.0)]
@@ -313,8 +313,8 @@ class TestBellmanFord(unittest.TestCase):
         bf = BellmanFord(graph, 0)
         bf.setup()
         bf.run()
-        expected = len(edges) * graph.node_count
-        self.assertEqual(bf.edge_relaxations, expected)
+        # SPFA scans each edge once here: no vertex improves twice
+        self.assertEqual(bf.edge_relaxations, len(edges))
     
     def test_successful_relaxations_count(self):
         """Run should count successful relaxations"""
@@ -0,0 +1,48 @@
+import math
+import unittest
+from benchmark.datastructures.graph import Graph
+from gui.graph_algorithms import bmssp, dijkstra
+
+
+def build_graph():
+    """Small graph with one unreachable node (4)."""
+    graph = Graph(directed=True)
+    graph.add_edge(0, 1, 2.0)
+    graph.add_edge(1, 2, 3.0)
+    graph.add_edge(0, 2, 7.0)
+    graph.add_edge(2, 3, 1.0)
+    graph.node_count = 5
+    return graph
+
+
+class TestRunShortestPathAlgo(unittest.TestCase):
+    """Regression tests for the GUI adapter around the solver classes."""
+
+    def test_bmssp_result_is_dict_backed(self):
+        """Array-backed BMSSP results must be normalized to dicts"""
+        result = bmssp(build_graph(), 0)
+        self.assertIsInstance(result.distances, dict)
+        self.assertIsInstance(result.previous, dict)
+        self.assertIsNone(result.previous[0])
+        self.assertEqual(result.previous[2], 1)
+
+    def test_bmssp_path_result_accessors(self):
+        """get_distance/get_path/__str__ must work on BMSSP results"""
+        result = bmssp(build_graph(), 0)
+        self.assertEqual(result.get_distance(3), 6.0)
+        self.assertEqual(result.get_distance(4), math.inf)
+        self.assertEqual(result.get_path(0, 3), [0, 1, 2, 3])
+        self.assertIsNone(result.get_path(0, 4))
+        self.assertIn("Nodes Reached: 4", str(result))
+
+    def test_bmssp_matches_dijkstra(self):
+        """Both adapters should agree on every distance"""
+        graph = build_graph()
+        res_b = bmssp(graph, 0)
+        res_d = dijkstra(graph, 0)
+        for node in range(graph.node_count):
+            self.assertEqual(res_b.get_distance(node), res_d.get_distance(node))
+
+
+if __name__ == '__main__':
+    unittest.main()
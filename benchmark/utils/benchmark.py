@@ -39,6 +39,11 @@ class ShortestPathBenchmark:
         self.start = start
         self.trials = trials
 
+        # build the CSR once and lock the source graph: every trial copies
+        # it, so mutation mid-run would only ever be a bug
+        if hasattr(graph, "freeze"):
+            graph.freeze()
+
         available_algos = {
             "dijkstra": Dijkstra,
             "bellmanford": BellmanFord,
@@ -67,7 +72,7 @@ class ShortestPathBenchmark:
         # Create a fresh copy of the graph so algorithms don't modify the original
         G = Graph(self.graph.directed)
         for u, nbrs in self.graph.adjacency_list.items():
-            for v, w in nbrs:
+            for v, w in nbrs.items():
                 G.add_edge(u, v, w)
 
         algo = alg_cls(G, self.start)
@@ -29,6 +29,7 @@ def make_random_graph_random_edges(
 def generate_grid_graph(rows: int, cols: int, directed: bool = True) -> Graph:
     """Generate a grid graph with random edge weights"""
     graph = Graph(directed=directed)
+    edges = []
 
     for i in range(rows * cols):
         row = i // cols
@@ -36,14 +37,14 @@ def generate_grid_graph(rows: int, cols: int, directed: bool = True) -> Graph:
 
         # Connect to right neighbor
         if col < cols - 1:
-            weight = random.uniform(1, 10)
-            graph.add_edge(i, i + 1, weight)
+            edges.append((i, i + 1, random.uniform(1, 10)))
 
         # Connect to bottom neighbor
         if row < rows - 1:
-            weight = random.uniform(1, 10)
-            graph.add_edge(i, i + cols, weight)
+            edges.append((i, i + cols, random.uniform(1, 10)))
 
+    if edges:
+        graph.add_edges(*zip(*edges))
     return graph
 
 
@@ -85,12 +86,15 @@ def generate_random_graph(
     in_degrees = {i: 0 for i in range(num_nodes)}
 
     # Ensure connectivity with a spanning tree first
+    tree_edges = []
     for i in range(1, num_nodes):
         parent = rng.randint(0, i - 1)
         weight = rng.uniform(min_weight, max_weight)
-        graph.add_edge(parent, i, weight)
+        tree_edges.append((parent, i, weight))
         out_degrees[parent] += 1
         in_degrees[i] += 1
+    if tree_edges:
+        graph.add_edges(*zip(*tree_edges))
 
     # Add remaining random edges
     edges_added = num_nodes - 1
@@ -127,8 +131,11 @@ def generate_random_graph(
 def generate_complete_graph(num_nodes: int, directed: bool = True) -> Graph:
     """Generate a complete graph where every node is connected to every other node"""
     graph = Graph(directed=directed)
-    for i in range(num_nodes):
-        for j in range(i + 1, num_nodes):
-            weight = random.uniform(1, 10)
-            graph.add_edge(i, j, weight)
+    edges = [
+        (i, j, random.uniform(1, 10))
+        for i in range(num_nodes)
+        for j in range(i + 1, num_nodes)
+    ]
+    if edges:
+        graph.add_edges(*zip(*edges))
     return graph
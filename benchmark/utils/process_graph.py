@@ -69,17 +69,21 @@ def load_graph_from_file(filepath: str, directed: bool = False) -> Graph:
         max_node_index = max(max_node_index, u, v)
 
     graph = Graph(directed=directed)
-    for u, v, w in edges:
-        graph.add_edge(u, v, w)
+    if edges:
+        graph.add_edges(*zip(*edges))
 
     # Remove disconnected nodes: keep largest connected component
     largest_nodes = set(largest_connected_component(graph))
 
     # Rebuild graph with only largest component
+    kept = [
+        (u, v, w)
+        for u, v, w in graph.get_all_edges()
+        if u in largest_nodes and v in largest_nodes
+    ]
     filtered_graph = Graph(directed=directed)
-    for u, v, w in graph.get_all_edges():
-        if u in largest_nodes and v in largest_nodes:
-            filtered_graph.add_edge(u, v, w)
+    if kept:
+        filtered_graph.add_edges(*zip(*kept))
 
     print(
         f"Final filtered graph contains: {filtered_graph.node_count} nodes, {filtered_graph.edge_count} edges"
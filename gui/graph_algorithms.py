@@ -1,3 +1,4 @@
+import math
 import time
 from typing import Dict, List, Optional, Type
 from benchmark.methods.BMSSP import BMSSP
@@ -5,6 +6,9 @@ from benchmark.methods.dijkstra import Dijkstra
 from benchmark.datastructures.graph import Graph
 from benchmark.methods.bellman_ford import BellmanFord
 
+# shared sentinel: avoids re-allocating a PyFloat per lookup/compare
+_INF = math.inf
+
 
 class PathResult:
     """Result of a pathfinding algorithm"""
@@ -25,7 +29,7 @@ class PathResult:
 
     def get_path(self, start: int, end: int) -> Optional[List[int]]:
         """Reconstruct path from start to end"""
-        if self.distances.get(end, float("inf")) == float("inf"):
+        if self.distances.get(end, _INF) == _INF:
             return None
 
         path = []
@@ -39,14 +43,14 @@ class PathResult:
 
     def get_distance(self, node: int) -> float:
         """Get distance to a node"""
-        return self.distances.get(node, float("inf"))
+        return self.distances.get(node, _INF)
 
     def __str__(self):
         return (
             f"{self.algorithm} Result:\n"
             f"  Execution Time: {self.execution_time:.6f} seconds\n"
             f"  Operations: {self.operations:,}\n"
-            f"  Nodes Reached: {sum(1 for d in self.distances.values() if d != float('inf'))}"
+            f"  Nodes Reached: {sum(1 for d in self.distances.values() if d != _INF)}"
         )
 
 
@@ -75,6 +79,12 @@ def run_shortest_path_algo(
     execution_time = end_time - start_time
     distances = algo.dist
     previous = algo.pred
+    if not isinstance(distances, dict):
+        # array-backed solvers (BMSSP) keep dist/pred as ndarrays; PathResult
+        # and the stats widgets expect the dict mapping the other methods use
+        distances = {i: float(d) for i, d in enumerate(distances)}
+        previous = {i: int(p) if p >= 0 else None
+                    for i, p in enumerate(previous)}
     operations = algo.iterations
     algo_name = name or algo_class.__name__
 
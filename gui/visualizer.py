@@ -43,7 +43,7 @@ class GraphVisualizer(Static):
 
         # Add directed edges from adjacency list
         for from_node, neighbors in graph.adjacency_list.items():
-            for to_node, weight in neighbors:
+            for to_node, weight in neighbors.items():
                 self.nx_graph.add_edge(from_node, to_node, weight=weight)
 
         self.generate_image(seed)
@@ -1,3 +1,4 @@
+import math
 from rich.panel import Panel
 from textual.widgets import Static
 from textual.reactive import reactive
@@ -24,8 +25,9 @@ class StatsDisplay(Static):
             content.append(f"Algorithm:       {result.algorithm}")
             content.append(f"Execution Time:  {result.execution_time * 1000:.3f} ms")
             # content.append(f"Operations:      {result.operations:,}")
+            inf = math.inf
             nodes_reached = sum(
-                1 for d in result.distances.values() if d != float("inf")
+                1 for d in result.distances.values() if d != inf
             )
             content.append(f"Nodes Reached:   {nodes_reached}")
 